@@ -12,6 +12,7 @@ Usage:
     python deploy.py --scrape-only      # Just scrape, no deploy
     python deploy.py --skip-scrape      # Just deploy existing data
     python deploy.py --no-push          # Commit but don't push
+    python deploy.py --in-process       # Scrape on threads in one interpreter
 """
 
 import argparse
@@ -19,8 +20,10 @@ import subprocess
 import sys
 import os
 import re
+import threading
 import time
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 
@@ -33,21 +36,32 @@ class GitHubDeployer:
         self.project_root = Path(__file__).parent
         self.data_dir = self.project_root / "data"
         self.errors = []
+        self._errors_lock = threading.Lock()
         
-    def run_command(self, cmd, description, check=True, timeout=None):
-        """Run a shell command and handle errors.
+    def record_error(self, error_msg):
+        """Record a warning/error; safe to call from scraper worker threads."""
+        with self._errors_lock:
+            self.errors.append(error_msg)
+        
+    def run_command(self, cmd, description, check=True, timeout=None, prefix=""):
+        """Run a command (argv list, no shell) and handle errors.
 
         Uses a process-group so timeouts reliably kill child processes (e.g., chromedriver).
 
         timeout: seconds (None = no timeout)
+        prefix: prepended to each output line so concurrent runs stay readable
         """
+        def emit(text):
+            if prefix:
+                text = "\n".join(f"{prefix}{line}" for line in text.splitlines())
+            print(text)
+
         print(f"\n{'='*60}")
         print(f"📋 {description}")
         print(f"{'='*60}")
 
         # Start in a new process group so we can kill the whole tree on timeout.
         popen_kwargs = {
-            "shell": True,
             "stdout": subprocess.PIPE,
             "stderr": subprocess.PIPE,
             "text": True,
@@ -76,15 +90,15 @@ class GitHubDeployer:
                 stdout, stderr = proc.communicate()
                 error_msg = f"⏱️ {description} - Timed out after {timeout}s (killed)"
                 print(error_msg)
-                self.errors.append(error_msg)
+                self.record_error(error_msg)
                 if stdout:
-                    print(stdout)
+                    emit(stdout)
                 if stderr:
-                    print(f"Error: {stderr}")
+                    emit(f"Error: {stderr}")
                 return False
 
             if stdout:
-                print(stdout)
+                emit(stdout)
 
             if proc.returncode == 0:
                 print(f"✅ {description} - Success!")
@@ -93,14 +107,14 @@ class GitHubDeployer:
             error_msg = f"❌ {description} - Failed!"
             print(error_msg)
             if stderr:
-                print(f"Error: {stderr}")
-            self.errors.append(error_msg)
+                emit(f"Error: {stderr}")
+            self.record_error(error_msg)
             return False
 
         except Exception as e:
             error_msg = f"❌ {description} - Unexpected error: {e}"
             print(error_msg)
-            self.errors.append(error_msg)
+            self.record_error(error_msg)
             return False
     
     def check_git_setup(self):
@@ -109,8 +123,7 @@ class GitHubDeployer:
         
         # Check if git is installed
         result = subprocess.run(
-            "git --version",
-            shell=True,
+            ["git", "--version"],
             capture_output=True
         )
         if result.returncode != 0:
@@ -119,8 +132,7 @@ class GitHubDeployer:
         
         # Check if we're in a git repo
         result = subprocess.run(
-            "git rev-parse --git-dir",
-            shell=True,
+            ["git", "rev-parse", "--git-dir"],
             capture_output=True,
             cwd=self.project_root
         )
@@ -131,8 +143,7 @@ class GitHubDeployer:
         
         # Check if remote is configured
         result = subprocess.run(
-            "git remote -v",
-            shell=True,
+            ["git", "remote", "-v"],
             capture_output=True,
             text=True,
             cwd=self.project_root
@@ -146,6 +157,34 @@ class GitHubDeployer:
         print(f"Remote(s):\n{result.stdout}")
         return True
     
+    def run_scraper(self, scraper):
+        """Run a single scraper in its own process; returns True on success."""
+        # FOX is intermittently flaky; retry once with a fresh browser if it times out/stalls.
+        timeout_s = 240 if scraper == "fox" else 180
+        prefix = f"[{scraper}] "
+
+        success = self.run_command(
+            [sys.executable, "-m", f"scrapers.{scraper}"],
+            f"Scraping {scraper.upper()}",
+            check=False,  # Don't stop if one fails
+            timeout=timeout_s,
+            prefix=prefix,
+        )
+
+        if not success and scraper == "fox":
+            print("🔁 FOX scrape failed; retrying once for freshest data...")
+            # small breather to avoid reusing a bad state
+            time.sleep(5)
+            success = self.run_command(
+                [sys.executable, "-m", f"scrapers.{scraper}"],
+                f"Scraping {scraper.upper()} (retry)",
+                check=False,
+                timeout=timeout_s,
+                prefix=prefix,
+            )
+
+        return success
+    
     def run_scrapers(self):
         """Run all scrapers to fetch latest data."""
         if self.args.skip_scrape:
@@ -157,68 +196,141 @@ class GitHubDeployer:
         print("="*60)
         
         scrapers = ['fox', 'paradise', 'revue', 'tiff', 'kingsway']
+        if self.args.in_process:
+            return self.run_scrapers_in_process(scrapers)
         all_success = True
         
-        for scraper in scrapers:
-            # FOX is intermittently flaky; retry once with a fresh browser if it times out/stalls.
-            timeout_s = 240 if scraper == "fox" else 180
-
-            success = self.run_command(
-                f"{sys.executable} -m scrapers.{scraper}",
-                f"Scraping {scraper.upper()}",
-                check=False,  # Don't stop if one fails
-                timeout=timeout_s,
-            )
-
-            if not success and scraper == "fox":
-                print("🔁 FOX scrape failed; retrying once for freshest data...")
-                # small breather to avoid reusing a bad state
-                try:
-                    import time
-                    time.sleep(5)
-                except Exception:
-                    pass
-                success = self.run_command(
-                    f"{sys.executable} -m scrapers.{scraper}",
-                    f"Scraping {scraper.upper()} (retry)",
-                    check=False,
-                    timeout=timeout_s,
-                )
-
-            if not success:
-                all_success = False
-                print(f"⚠️  Warning: {scraper} scraper failed, continuing...")
+        # Each scraper hits a different site, so run them all at once; wall
+        # time is bounded by the slowest scraper instead of their sum.
+        with ThreadPoolExecutor(max_workers=len(scrapers)) as executor:
+            futures = {
+                executor.submit(self.run_scraper, scraper): scraper
+                for scraper in scrapers
+            }
+            for future in as_completed(futures):
+                scraper = futures[future]
+                if not future.result():
+                    all_success = False
+                    print(f"⚠️  Warning: {scraper} scraper failed, continuing...")
         
         if not all_success:
             print("\n⚠️  Some scrapers failed, but continuing with available data...")
         
         return True  # Continue even if some scrapers fail
     
+    def run_scrapers_in_process(self, scrapers):
+        """Run the scrapers on threads in this interpreter.
+
+        Skips a fresh Python startup and re-import of selenium for every
+        scraper. Per-scraper timeouts cannot be enforced on threads, so the
+        subprocess path stays the default. The scrapers write to data/
+        relative to the working directory, so that is the project root while
+        they run (as it is for the subprocesses).
+        """
+        from main import run_scrapers_parallel
+        
+        cwd = os.getcwd()
+        try:
+            os.chdir(self.project_root)
+            results = run_scrapers_parallel(scrapers)
+        finally:
+            os.chdir(cwd)
+        failed = [r for r in results if not r["success"]]
+        for result in failed:
+            error_msg = f"❌ Scraping {result['theater'].upper()} - Failed! ({result['error']})"
+            print(f"⚠️  Warning: {result['theater']} scraper failed, continuing...")
+            self.record_error(error_msg)
+        
+        if failed:
+            print("\n⚠️  Some scrapers failed, but continuing with available data...")
+        
+        return True  # Continue even if some scrapers fail
+    
     def generate_calendar(self):
-        """Generate the HTML calendar from scraped data."""
+        """Generate the HTML calendar from scraped data.
+
+        generator.main() itself leaves index.html alone when the screenings
+        it would show are unchanged (see generator.calendar_hash), so there
+        is no separate check here.
+        """
         print("\n" + "="*60)
         print("📅 GENERATION PHASE - Creating HTML Calendar")
         print("="*60)
         
-        return self.run_command(
-            f"{sys.executable} generator.py",
-            "Generating HTML calendar"
-        )
+        return self.run_generator()
+    
+    def run_generator(self):
+        """Run generator.main() in this process; returns True on success.
+
+        Saves starting a second interpreter just to import and run the
+        generator. It reads and writes paths relative to the project root,
+        so that is the working directory while it runs.
+        """
+        description = "Generating HTML calendar"
+        print(f"\n{'='*60}")
+        print(f"📋 {description}")
+        print(f"{'='*60}")
+        
+        from generator import main as generate_calendar
+        
+        cwd = os.getcwd()
+        try:
+            os.chdir(self.project_root)
+            generate_calendar()
+        except Exception as e:
+            error_msg = f"❌ {description} - Failed! ({e})"
+            print(error_msg)
+            self.record_error(error_msg)
+            return False
+        finally:
+            os.chdir(cwd)
+        
+        print(f"✅ {description} - Success!")
+        return True
     
-    def check_changes(self):
-        """Check if there are any changes to commit."""
+    def stage_changes(self):
+        """Stage the generated files and report whether anything changed.
+
+        `git diff --cached --stat --exit-code` lists the staged changes and
+        exits 1 only when there are some; any other non-zero code is a git
+        error. The data/*.json glob is a git pathspec, so git expands it
+        itself (no shell needed).
+
+        Returns:
+            True if changes are staged, False if there is nothing to commit,
+            None if staging failed.
+        """
         result = subprocess.run(
-            "git status --porcelain",
-            shell=True,
+            ["git", "add", "data/*.json", "index.html", "data/last_success.json"],
             capture_output=True,
             text=True,
             cwd=self.project_root
         )
+        if result.returncode != 0:
+            error_msg = "❌ Staging changes - Failed!"
+            print(error_msg)
+            if result.stderr:
+                print(f"Error: {result.stderr}")
+            self.record_error(error_msg)
+            return None
         
-        if not result.stdout.strip():
+        result = subprocess.run(
+            ["git", "diff", "--cached", "--stat", "--exit-code"],
+            capture_output=True,
+            text=True,
+            cwd=self.project_root
+        )
+        if result.returncode == 0:
             print("\n📭 No changes detected - nothing to deploy!")
             return False
-        
+        if result.returncode != 1:
+            error_msg = "❌ Checking staged changes - Failed!"
+            print(error_msg)
+            if result.stderr:
+                print(f"Error: {result.stderr}")
+            self.record_error(error_msg)
+            return None
+
         print("\n📝 Changes detected:")
         print(result.stdout)
         return True
@@ -233,42 +345,27 @@ class GitHubDeployer:
         print("🚀 DEPLOYMENT PHASE - Pushing to GitHub")
         print("="*60)
         
-        # Check if there are changes
-        if not self.check_changes():
-            return True
-        
-        # Add all changes
-        if not self.run_command(
-            "git add data/*.json index.html data/last_success.json",
-            "Staging changes"
-        ):
+        # Stage and check for changes in one go
+        staged = self.stage_changes()
+        if staged is None:
             return False
+        if not staged:
+            return True
         
-        # Commit with timestamp
+        # Commit with timestamp and push the current branch (main or master)
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         commit_message = f"Update calendar - {timestamp}"
         
         if not self.run_command(
-            f'git commit -m "{commit_message}"',
+            ["git", "commit", "-m", commit_message],
             "Committing changes"
         ):
             return False
         
-        # Push to GitHub
-        if not self.run_command(
-            "git push origin main",
-            "Pushing to GitHub",
-            check=False  # Don't fail if branch name is different
-        ):
-            # Try 'master' if 'main' fails
-            print("ℹ️  Trying 'master' branch...")
-            if not self.run_command(
-                "git push origin master",
-                "Pushing to GitHub (master branch)"
-            ):
-                return False
-        
-        return True
+        return self.run_command(
+            ["git", "push", "origin", "HEAD"],
+            "Pushing to GitHub"
+        )
 
     def verify_live_site(self, max_wait_s=240, interval_s=15):
         """Verify GitHub Pages reflects a fresh deploy *and* today's calendar state."""
@@ -350,7 +447,7 @@ class GitHubDeployer:
 
             # Phase 2.5: Sanity check current scrape against previous baseline
             sanity = self.run_command(
-                f"{sys.executable} check_sanity.py",
+                [sys.executable, "check_sanity.py"],
                 "Sanity checking scraped counts",
                 check=False,
                 timeout=30,
@@ -362,7 +459,7 @@ class GitHubDeployer:
         # Phase 3: Write success metadata, then deploy
         if not self.args.scrape_only:
             success_meta = self.run_command(
-                f"{sys.executable} write_last_success.py",
+                [sys.executable, "write_last_success.py"],
                 "Writing last success metadata",
                 check=False,
                 timeout=30,
@@ -419,6 +516,12 @@ def main():
         help='Generate and commit, but do not push to GitHub'
     )
     
+    parser.add_argument(
+        '--in-process',
+        action='store_true',
+        help='Run scrapers on threads in this process instead of one subprocess each (no per-scraper timeout)'
+    )
+    
     parser.add_argument(
         '--continue-on-error',
         action='store_true',
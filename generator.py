@@ -5,19 +5,32 @@ Loads scraped film data and generates an interactive HTML calendar
 with proper chronological sorting.
 """
 
+import gzip
+import hashlib
 import json
 import os
 import re
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, Iterator, List, NamedTuple, Tuple
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import attrgetter
+from html import escape
 from zoneinfo import ZoneInfo
 
+try:
+    import orjson  # optional: much faster JSON decoding
+except ImportError:
+    orjson = None
+
 
 # Configuration
 DATA_DIR = "data"
 HTML_OUTPUT = "index.html"
+# The page's calendar_hash, embedded in its <head> (read back by main())
+CALENDAR_HASH_PATTERN = re.compile(r"<meta name='calendar-hash' content='([0-9a-f]*)'>")
 
 THEATERS = {
     "revue": {"name": "Revue Cinema", "color": "#3b82f6"},
@@ -27,12 +40,55 @@ THEATERS = {
     "kingsway": {"name": "Kingsway Theatre", "color": "#8b5cf6"},
 }
 
-
+# Reverse lookup: theater display name (a film's "source") -> CSS class / theater id
+THEATER_CLASS_BY_NAME = {info["name"]: theater_id for theater_id, info in THEATERS.items()}
+
+# Day/month names indexed by date.weekday() / date.month (used instead of strftime)
+DAY_NAMES = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+MONTH_NAMES = (
+    "", "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December",
+)
+MONTH_NUMBERS = {name: num for num, name in enumerate(MONTH_NAMES) if name}
+
+# Short or full day/month name -> full name, used by normalize_date
+DAY_ABBREVIATIONS = {**{name[:3]: name for name in DAY_NAMES}, **{name: name for name in DAY_NAMES}}
+MONTH_ABBREVIATIONS = {**{name[:3]: name for name in MONTH_NAMES if name},
+                       **{name: name for name in MONTH_NAMES if name}}
+
+# Patterns used on every film; compiled once here instead of per call
+TIME_PATTERN = re.compile(r'(\d{1,2}):(\d{2})\s*(AM|PM)', re.IGNORECASE)
+TIME_TEXT_PATTERN = re.compile(r'(\d{1,2}:\d{2}\s*(?:AM|PM|am|pm)(?:\s*\([^)]+\))?)')
+# "Today..." / "Tomorrow..." (group 1), else "Tue Jan 27" / "Tuesday, January 27" (groups 2-4)
+DATE_PATTERN = re.compile(r'(Today|Tomorrow)|(\w+),?\s+(\w+)\s+(\d+)')
+NORMALIZED_DATE_PATTERN = re.compile(r'^\w+,\s+(\w+)\s+(\d{1,2})$')  # "Tuesday, January 27" only
+DATE_PARTS_PATTERN = re.compile(r'(\w+),\s+(\w+)\s+(\d+)')
+
+class Screening(NamedTuple):
+    """One screening as rendered in the calendar (markup pre-rendered)."""
+    showtime: str
+    source: str
+    theater_class: str
+    time_key: int
+    row_html: str
+
+
+# Markup for one screening, shared by the grid and list views
+FILM_TEMPLATE = (
+    "<div class='film {theater_class}' data-source='{source}'>"
+    "<span class='time'>{time}</span>"
+    "<a href='{link}' target='_blank' title='{source}'>{title}</a>"
+    "</div>\n"
+)
+
+
+@lru_cache(maxsize=None)
 def parse_time_for_sorting(showtime_str: str) -> int:
     """
     Extract time from showtime string and convert to minutes since midnight.
     
     This enables proper chronological sorting (12:00 PM before 10:00 PM).
+    Cached on the raw showtime, which repeats across theaters and films.
     
     Args:
         showtime_str: Full showtime like "Monday, January 26, 3:45 PM"
@@ -40,15 +96,28 @@ def parse_time_for_sorting(showtime_str: str) -> int:
     Returns:
         Minutes since midnight (0-1439) for sorting
     """
-    # Extract time portion with regex
-    time_match = re.search(r'(\d{1,2}):(\d{2})\s*(AM|PM)', showtime_str, re.IGNORECASE)
-    
-    if not time_match:
-        return 0  # Default to midnight if can't parse
-    
-    hours = int(time_match.group(1))
-    minutes = int(time_match.group(2))
-    am_pm = time_match.group(3).upper()
+    # Fast path: the time is almost always the last comma-separated field,
+    # e.g. "3:45 PM" or "6:00PM (Free)"; slice it apart without a regex
+    tail = showtime_str.rsplit(',', 1)[-1].strip()
+    colon = tail.find(':')
+    hour_text = tail[:colon]
+    minute_text = tail[colon + 1:colon + 3]
+    am_pm = tail[colon + 3:].lstrip()[:2].upper()
+    
+    if (colon in (1, 2) and hour_text.isdigit() and len(minute_text) == 2
+            and minute_text.isdigit() and am_pm in ('AM', 'PM')):
+        hours = int(hour_text)
+        minutes = int(minute_text)
+    else:
+        # Anything unusual: fall back to searching the whole string
+        time_match = TIME_PATTERN.search(showtime_str)
+        
+        if not time_match:
+            return 0  # Default to midnight if can't parse
+        
+        hours = int(time_match.group(1))
+        minutes = int(time_match.group(2))
+        am_pm = time_match.group(3).upper()
     
     # Convert to 24-hour format
     if am_pm == 'PM' and hours != 12:
@@ -60,29 +129,69 @@ def parse_time_for_sorting(showtime_str: str) -> int:
     return hours * 60 + minutes
 
 
+@lru_cache(maxsize=None)
+def format_date(date_obj) -> str:
+    """Format a date as "Monday, January 26" (day number without zero-padding)."""
+    return f"{DAY_NAMES[date_obj.weekday()]}, {MONTH_NAMES[date_obj.month]} {date_obj.day}"
+
+
+def read_films_file(json_file: str) -> List[Dict]:
+    """Read one theater's JSON file (orjson when available)."""
+    if orjson is not None:
+        with open(json_file, "rb") as f:
+            return orjson.loads(f.read())
+    with open(json_file, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+@lru_cache(maxsize=4096)
+def escape_html(text: str) -> str:
+    """html.escape (quotes included), cached: titles, links and theater names
+    repeat across many screenings."""
+    return escape(text, quote=True)
+
+
 def load_all_films() -> List[Dict]:
-    """Load all film data from JSON files in the data directory."""
+    """Load all film data from JSON files in the data directory.
+    
+    Files are read concurrently but merged in THEATERS order, so the
+    result (and the order of same-time screenings) is deterministic.
+    """
     all_films = []
     
+    # One directory listing instead of an exists() stat per theater
+    try:
+        with os.scandir(DATA_DIR) as entries:
+            present = {entry.name: entry.path for entry in entries if entry.is_file()}
+    except FileNotFoundError:
+        present = {}
+    
+    json_files = {}
     for theater_id in THEATERS.keys():
-        json_file = os.path.join(DATA_DIR, f"{theater_id}_films.json")
+        file_name = f"{theater_id}_films.json"
         
-        if not os.path.exists(json_file):
-            print(f"⚠️  Warning: {json_file} not found, skipping...")
+        if file_name not in present:
+            print(f"⚠️  Warning: {os.path.join(DATA_DIR, file_name)} not found, skipping...")
             continue
-            
-        try:
-            with open(json_file, "r", encoding="utf-8") as f:
-                films = json.load(f)
+        json_files[theater_id] = present[file_name]
+    
+    with ThreadPoolExecutor(max_workers=max(len(json_files), 1)) as executor:
+        futures = {
+            theater_id: executor.submit(read_films_file, json_file)
+            for theater_id, json_file in json_files.items()
+        }
+        for theater_id, future in futures.items():
+            try:
+                films = future.result()
                 all_films.extend(films)
                 print(f"✅ Loaded {len(films)} films from {theater_id}")
-        except Exception as e:
-            print(f"❌ Error loading {json_file}: {e}")
+            except Exception as e:
+                print(f"❌ Error loading {json_files[theater_id]}: {e}")
             
     return all_films
 
 
-def normalize_date(date_str: str) -> str:
+def normalize_date(date_str: str, today: date = None) -> str:
     """
     Normalize date strings to a standard format: "Monday, January 26"
     
@@ -95,74 +204,29 @@ def normalize_date(date_str: str) -> str:
     
     Args:
         date_str: Date string in any format
+        today: Date that "Today" refers to (defaults to the local date)
         
     Returns:
         Normalized date string
     """
-    # Day name mappings
-    day_map = {
-        'Mon': 'Monday', 'Tue': 'Tuesday', 'Wed': 'Wednesday', 'Thu': 'Thursday',
-        'Fri': 'Friday', 'Sat': 'Saturday', 'Sun': 'Sunday',
-        'Monday': 'Monday', 'Tuesday': 'Tuesday', 'Wednesday': 'Wednesday',
-        'Thursday': 'Thursday', 'Friday': 'Friday', 'Saturday': 'Saturday', 'Sunday': 'Sunday'
-    }
-    
-    # Month name mappings
-    month_map = {
-        'Jan': 'January', 'Feb': 'February', 'Mar': 'March', 'Apr': 'April',
-        'May': 'May', 'Jun': 'June', 'Jul': 'July', 'Aug': 'August',
-        'Sep': 'September', 'Oct': 'October', 'Nov': 'November', 'Dec': 'December',
-        'January': 'January', 'February': 'February', 'March': 'March', 'April': 'April',
-        'June': 'June', 'July': 'July', 'August': 'August',
-        'September': 'September', 'October': 'October', 'November': 'November', 'December': 'December'
-    }
-    
     # Remove leading/trailing whitespace and commas
     date_str = date_str.strip().rstrip(',').strip()
     
-    # Handle "Today" and "Tomorrow" relative dates
-    today = datetime.now()
-    
-    if date_str.startswith("Today"):
-        # Extract month and day if present: "Today, Jan 26"
-        match = re.search(r'Today,?\s+(\w+)\s+(\d+)', date_str)
-        if match:
-            # Use today's date
-            target_date = today
-        else:
-            target_date = today
-        # Format as standard date
-        day_name = target_date.strftime("%A")
-        month_name = target_date.strftime("%B")
-        day_num = target_date.strftime("%d").lstrip('0')
-        return f"{day_name}, {month_name} {day_num}"
-        
-    elif date_str.startswith("Tomorrow"):
-        # Extract month and day if present: "Tomorrow, Jan 27"
-        match = re.search(r'Tomorrow,?\s+(\w+)\s+(\d+)', date_str)
-        if match:
-            # Use tomorrow's date
-            target_date = today + timedelta(days=1)
-        else:
-            target_date = today + timedelta(days=1)
-        # Format as standard date
-        day_name = target_date.strftime("%A")
-        month_name = target_date.strftime("%B")
-        day_num = target_date.strftime("%d").lstrip('0')
-        return f"{day_name}, {month_name} {day_num}"
-    
-    # Try to match pattern: "Day Month DD" or "Day, Month DD"
-    # Examples: "Tue Jan 27", "Tue, Jan 27", "Tuesday, January 27"
-    match = re.match(r'(\w+),?\s+(\w+)\s+(\d+)', date_str)
+    # One match decides the format: a relative keyword or "Day Month DD"
+    # (any "Jan 26" after the keyword is ignored: the keyword decides the date)
+    # Examples: "Today, Jan 26", "Tue Jan 27", "Tue, Jan 27", "Tuesday, January 27"
+    match = DATE_PATTERN.match(date_str)
     
     if match:
-        day_abbr = match.group(1)
-        month_abbr = match.group(2)
-        day_num = match.group(3)
+        relative, day_abbr, month_abbr, day_num = match.groups()
+        if relative:
+            if today is None:
+                today = datetime.now().date()
+            return format_date(today if relative == "Today" else today + timedelta(days=1))
         
         # Convert to full names
-        day_full = day_map.get(day_abbr, day_abbr)
-        month_full = month_map.get(month_abbr, month_abbr)
+        day_full = DAY_ABBREVIATIONS.get(day_abbr, day_abbr)
+        month_full = MONTH_ABBREVIATIONS.get(month_abbr, month_abbr)
         
         # Strip leading zeros from day number (01 → 1)
         day_num = str(int(day_num))
@@ -173,9 +237,14 @@ def normalize_date(date_str: str) -> str:
     return date_str
 
 
-def extract_date(showtime: str) -> str:
+@lru_cache(maxsize=1024)
+def extract_date(showtime: str, today: date) -> str:
     """
     Extract and normalize the date portion from a showtime string.
+
+    Cached on (showtime, today): the same string repeats across many films
+    (every screening of a date shares its prefix), and "Today"/"Tomorrow"
+    showtimes only resolve the same way on the same day.
     
     Handles formats like:
     - "Monday, January 26, 3:45 PM" → "Monday, January 26"
@@ -184,6 +253,7 @@ def extract_date(showtime: str) -> str:
     
     Args:
         showtime: Full showtime string
+        today: Date that "Today" refers to
         
     Returns:
         Normalized date portion of the showtime
@@ -194,41 +264,37 @@ def extract_date(showtime: str) -> str:
         # Join all parts except the last one (time part)
         date_part = ','.join(parts[:-1]).strip()
         # Normalize the date format
-        return normalize_date(date_part)
+        return normalize_date(date_part, today)
     
     # For formats without comma like "Tue Jan 27 07:00 PM"
     # Extract just the date part (first 3 words)
     words = showtime.split()
     if len(words) >= 3:
         date_part = ' '.join(words[:3])
-        return normalize_date(date_part)
+        return normalize_date(date_part, today)
     
-    return normalize_date(showtime)
+    return normalize_date(showtime, today)
 
 
-def date_to_obj(date_str: str, tz: str = "America/Toronto"):
+def date_to_obj(date_str: str, tz: str = "America/Toronto", today=None):
     """Convert a normalized date string like "Monday, January 26" into a date object.
 
-    We infer the year based on the current date in the given timezone.
+    We infer the year based on the current date in the given timezone. Pass
+    `today` to reuse one clock reading across many calls.
     """
     # Expect: "<DayName>, <MonthName> <Day>"
-    m = re.search(r'^\w+,\s+(\w+)\s+(\d{1,2})$', date_str.strip())
+    m = NORMALIZED_DATE_PATTERN.search(date_str.strip())
     if not m:
         return None
 
     month_name = m.group(1)
     day_num = int(m.group(2))
 
-    month_order = {
-        'January': 1, 'February': 2, 'March': 3, 'April': 4,
-        'May': 5, 'June': 6, 'July': 7, 'August': 8,
-        'September': 9, 'October': 10, 'November': 11, 'December': 12
-    }
-    month = month_order.get(month_name)
+    month = MONTH_NUMBERS.get(month_name)
     if not month:
         return None
 
-    now = datetime.now(ZoneInfo(tz)).date()
+    now = today or datetime.now(ZoneInfo(tz)).date()
     year = now.year
 
     # Handle year rollover for schedules that span Dec -> Jan
@@ -242,9 +308,11 @@ def date_to_obj(date_str: str, tz: str = "America/Toronto"):
         return None
 
 
+@lru_cache(maxsize=None)
 def extract_time(showtime: str) -> str:
     """
-    Extract just the time portion from a showtime string.
+    Extract just the time portion from a showtime string (cached like
+    parse_time_for_sorting).
     
     Args:
         showtime: Full showtime string like "Monday, January 26, 3:45 PM"
@@ -253,7 +321,7 @@ def extract_time(showtime: str) -> str:
         Time string like "3:45 PM"
     """
     # Extract time with regex
-    time_match = re.search(r'(\d{1,2}:\d{2}\s*(?:AM|PM|am|pm)(?:\s*\([^)]+\))?)', showtime)
+    time_match = TIME_TEXT_PATTERN.search(showtime)
     if time_match:
         return time_match.group(1).strip()
     
@@ -265,7 +333,7 @@ def extract_time(showtime: str) -> str:
     return showtime
 
 
-def parse_and_organize_films(all_films: List[Dict]) -> Tuple[Dict, List[Tuple]]:
+def parse_and_organize_films(all_films: List[Dict]) -> Tuple[Dict, List[Tuple], Dict]:
     """
     Organize films by date and sort them chronologically.
     
@@ -273,9 +341,11 @@ def parse_and_organize_films(all_films: List[Dict]) -> Tuple[Dict, List[Tuple]]:
         all_films: List of film dictionaries
         
     Returns:
-        Tuple of (date_map, sorted_months) where:
-        - date_map: Dict mapping date strings to sorted lists of films
+        Tuple of (date_map, sorted_months, dates_by_month) where:
+        - date_map: Dict mapping date strings to time-sorted lists of Screening,
+          in chronological order
         - sorted_months: List of (month_name, year) tuples in chronological order
+        - dates_by_month: Dict mapping (month_name, year) to that month's dates, in order
     """
     # Group films by date
     date_map = defaultdict(list)
@@ -284,82 +354,174 @@ def parse_and_organize_films(all_films: List[Dict]) -> Tuple[Dict, List[Tuple]]:
     today = datetime.now(ZoneInfo("America/Toronto")).date()
     dropped = 0
 
+    # Each distinct date string is resolved to a date once and reused for
+    # every screening on it (and again for the month grouping below)
+    date_objs = {}
+
     for film in all_films:
-        date_str = extract_date(film['showtime'])
-        date_obj = date_to_obj(date_str)
+        date_str = extract_date(film['showtime'], today)
+        if date_str in date_objs:
+            date_obj = date_objs[date_str]
+        else:
+            date_obj = date_objs[date_str] = date_to_obj(date_str, today=today)
 
         # If we can parse the date, enforce: date >= today
         if date_obj and date_obj < today:
             dropped += 1
             continue
 
-        date_map[date_str].append(film)
+        # Render the film's row once here rather than on every emission
+        # (each film is rendered in both the grid and list views)
+        showtime = film['showtime']
+        source = film.get('source', '')
+        theater_class = get_theater_class(source)
+        source_html = escape_html(source)
+        date_map[date_str].append(Screening(
+            showtime=showtime,
+            source=source,
+            theater_class=theater_class,
+            time_key=parse_time_for_sorting(showtime),
+            row_html=FILM_TEMPLATE.format(
+                theater_class=theater_class,
+                source=source_html,
+                time=escape_html(extract_time(showtime)),
+                link=escape_html(film.get('link') or ''),
+                title=escape_html(film.get('title', '')),
+            ),
+        ))
     
     # Sort films within each day by time (CRITICAL FIX!)
-    for date in date_map:
-        date_map[date].sort(key=lambda f: parse_time_for_sorting(f['showtime']))
+    for date_str in date_map:
+        date_map[date_str].sort(key=attrgetter('time_key'))
     
-    # Extract and sort unique months
-    month_set = set()
-    for date_str in date_map.keys():
-        date_obj = date_to_obj(date_str)
+    if dropped:
+        print(f"🧹 Filtered out {dropped} past screenings (before {today.isoformat()})")
+
+    # Key each date as (year, month number, day, month name) from the dates
+    # already resolved above, so dates and months sort as plain tuples
+    date_keys = {}
+    for date_str in date_map:
+        date_obj = date_objs[date_str]
         if date_obj:
-            month_set.add((date_obj.strftime('%B'), date_obj.year))
+            date_keys[date_str] = (date_obj.year, date_obj.month, date_obj.day, MONTH_NAMES[date_obj.month])
         else:
             # Fallback: best-effort month name, current year
-            match = re.search(r'(\w+),\s+(\w+)\s+\d+', date_str)
+            match = DATE_PARTS_PATTERN.search(date_str)
             if match:
-                month_set.add((match.group(2), datetime.now().year))
+                month_name = match.group(2)
+                date_keys[date_str] = (datetime.now().year, MONTH_NUMBERS.get(month_name, 13),
+                                       int(match.group(3)), month_name)
+    ordered_dates = sorted(date_map, key=lambda d: date_keys.get(d, (0, 0, 0, "")))
+
+    # Bucket the ordered dates by month and collect the months in one pass
+    month_set = set()
+    dates_by_month = defaultdict(list)
+    for date_str in ordered_dates:
+        if date_str not in date_keys:
+            continue
+        year, month_num, _, month_name = date_keys[date_str]
+        month_set.add((year, month_num, month_name))
+        dates_by_month[(month_name, year)].append(date_str)
     
     # Sort months chronologically
-    month_order = {
-        'January': 1, 'February': 2, 'March': 3, 'April': 4,
-        'May': 5, 'June': 6, 'July': 7, 'August': 8,
-        'September': 9, 'October': 10, 'November': 11, 'December': 12
-    }
-    
-    sorted_months = sorted(
-        month_set,
-        key=lambda m: (m[1], month_order.get(m[0], 13))
-    )
-
-    if dropped:
-        print(f"🧹 Filtered out {dropped} past screenings (before {today.isoformat()})")
+    sorted_months = [(month_name, year) for year, _, month_name in sorted(month_set)]
 
-    return dict(date_map), sorted_months
+    return (
+        {date_str: date_map[date_str] for date_str in ordered_dates},
+        sorted_months,
+        dict(dates_by_month),
+    )
 
 
 def get_theater_class(source: str) -> str:
     """Get CSS class name for a theater based on its source name."""
-    for theater_id, info in THEATERS.items():
-        if info["name"] == source:
-            return theater_id
-    return "unknown"
+    return THEATER_CLASS_BY_NAME.get(source, "unknown")
+
+
+# Wrapper markup for each calendar view; the film rows inside are identical
+VIEW_LAYOUTS = {
+    "grid": {
+        "open": "<div id='grid-view'>\n",
+        "month_open": "<h2>{month} {year}</h2><div class='grid'>\n",
+        "month_close": "</div>\n",
+        "day_open": "<div class='day-box' data-sources='{sources}'><h3>{date}</h3>\n",
+    },
+    "list": {
+        "open": "<div id='list-view' class='hidden'>\n",
+        "month_open": "<h2>{month} {year}</h2>\n",
+        "month_close": "",
+        "day_open": "<div class='list-day' data-sources='{sources}'><h2>{date}</h2>\n",
+    },
+}
 
 
-def generate_html(date_map: Dict, sorted_months: List[Tuple]) -> str:
+def render_view(view: str, sorted_months: List[Tuple], dates_by_month: Dict,
+                day_blocks: Dict) -> Iterator[str]:
     """
-    Generate the complete HTML calendar.
+    Render one calendar view ("grid" or "list") as a sequence of HTML parts.
+    
+    Args:
+        view: Key into VIEW_LAYOUTS
+        sorted_months: List of (month_name, year) tuples
+        dates_by_month: Dictionary mapping (month_name, year) to its dates, in order
+        day_blocks: Dictionary mapping dates to (space-separated theater classes,
+            that day's joined film rows)
+        
+    Yields:
+        HTML strings for the view
+    """
+    layout = VIEW_LAYOUTS[view]
+    yield layout["open"]
+    
+    for month_name, year in sorted_months:
+        yield (layout["month_open"].format(month=month_name, year=year))
+        
+        for date_str in dates_by_month.get((month_name, year), ()):
+            sources, rows_html = day_blocks[date_str]
+            
+            # data-sources lets the filter JS hide a day without scanning its films
+            yield (layout["day_open"].format(date=escape_html(date_str), sources=sources))
+            if rows_html:
+                yield rows_html
+            yield ("</div>\n")
+        
+        if layout["month_close"]:
+            yield (layout["month_close"])
+    
+    yield "</div>\n"
+
+
+def iter_html_parts(date_map: Dict, sorted_months: List[Tuple], dates_by_month: Dict,
+                    content_hash: str = None) -> Iterator[str]:
+    """
+    Generate the complete HTML calendar as a sequence of parts.
+    
+    Parts are meant to be joined with newlines (see generate_html/write_html).
     
     Args:
         date_map: Dictionary mapping dates to lists of films
         sorted_months: List of (month_name, year) tuples
+        dates_by_month: Dictionary mapping (month_name, year) to its dates, in order
+        content_hash: calendar_hash(date_map), if already computed; it is
+            embedded in the page so a later run can tell what the page shows
         
-    Returns:
-        Complete HTML string
+    Yields:
+        HTML strings
     """
     # Calculate stats
     total_screenings = sum(len(films) for films in date_map.values())
     total_days = len(date_map)
     
-    html_parts = []
+    if content_hash is None:
+        content_hash = calendar_hash(date_map)
     
     # HTML Header
-    html_parts.append("""<!DOCTYPE html>
+    yield ("""<!DOCTYPE html>
 <html lang='en'>
 <head>
 <meta charset='UTF-8'>
 <meta name='viewport' content='width=device-width, initial-scale=1'>
+""" f"<meta name='calendar-hash' content='{content_hash}'>" """
 <title>Toronto Rep Cinema Calendar</title>
 <style>
 body { 
@@ -421,12 +583,13 @@ h2 {
     # Theater-specific styles
     for theater_id, info in THEATERS.items():
         color = info["color"]
-        html_parts.append(f"""
+        yield (f"""
 .toggle.{theater_id} {{ background-color: {color}; }}
 .{theater_id} .time {{ background-color: {color}; }}
+body.hide-{theater_id} .film.{theater_id} {{ display: none; }}
 """)
     
-    html_parts.append(""".view-buttons { 
+    yield (""".view-buttons { 
     margin-bottom: 1rem; 
     text-align: center;
 }
@@ -504,12 +667,12 @@ h2 {
     
     # Theater filter buttons
     for theater_id, info in THEATERS.items():
-        html_parts.append(
+        yield (
             f"    <button class='toggle {theater_id} active' "
-            f"data-source='{info['name']}'>{info['name'].split()[0].upper()}</button>\n"
+            f"data-theater='{theater_id}' data-source='{info['name']}'>{info['name'].split()[0].upper()}</button>\n"
         )
     
-    html_parts.append("""  </div>
+    yield ("""  </div>
   <div class='view-buttons'>
     <button onclick="toggleView('grid-view')">🗓️ Grid View</button>
     <button onclick="toggleView('list-view')">📃 List View</button>
@@ -517,134 +680,120 @@ h2 {
 </div>
 """)
     
-    # Grid View
-    html_parts.append("<div id='grid-view'>\n")
-    
-    for month_name, year in sorted_months:
-        html_parts.append(f"<h2>{month_name} {year}</h2><div class='grid'>\n")
-        
-        # Get all dates for this month and sort them
-        month_dates = [
-            date for date in date_map.keys()
-            if month_name in date
-        ]
-        
-        # Sort dates chronologically
-        def date_sort_key(date_str):
-            match = re.search(r'(\w+),\s+(\w+)\s+(\d+)', date_str)
-            if match:
-                day_num = int(match.group(3))
-                return day_num
-            return 0
-        
-        month_dates.sort(key=date_sort_key)
-        
-        for date in month_dates:
-            films = date_map[date]
-            html_parts.append(f"<div class='day-box'><h3>{date}</h3>\n")
-            
-            for film in films:
-                theater_class = get_theater_class(film['source'])
-                time_str = extract_time(film['showtime'])
-                
-                html_parts.append(
-                    f"<div class='film {theater_class}' data-source='{film['source']}'>"
-                    f"<span class='time'>{time_str}</span>"
-                    f"<a href='{film['link']}' target='_blank' title='{film['source']}'>{film['title']}</a>"
-                    f"</div>\n"
-                )
-            
-            html_parts.append("</div>\n")
-        
-        html_parts.append("</div>\n")
-    
-    html_parts.append("</div>\n")
-    
-    # List View
-    html_parts.append("<div id='list-view' class='hidden'>\n")
-    
-    for month_name, year in sorted_months:
-        html_parts.append(f"<h2>{month_name} {year}</h2>\n")
-        
-        month_dates = [
-            date for date in date_map.keys()
-            if month_name in date
-        ]
-        month_dates.sort(key=date_sort_key)
-        
-        for date in month_dates:
-            films = date_map[date]
-            html_parts.append(f"<div class='list-day'><h2>{date}</h2>\n")
-            
-            for film in films:
-                theater_class = get_theater_class(film['source'])
-                time_str = extract_time(film['showtime'])
-                
-                html_parts.append(
-                    f"<div class='film {theater_class}' data-source='{film['source']}'>"
-                    f"<span class='time'>{time_str}</span>"
-                    f"<a href='{film['link']}' target='_blank' title='{film['source']}'>{film['title']}</a>"
-                    f"</div>\n"
-                )
-            
-            html_parts.append("</div>\n")
-        
-    html_parts.append("</div>\n")
+    # Per-day markup shared by both views, built once: the theaters showing
+    # (in first-screening order) and the film rows joined into a single part
+    day_blocks = {
+        date_str: (
+            " ".join(dict.fromkeys(film.theater_class for film in films)),
+            "\n".join([film.row_html for film in films]),
+        )
+        for date_str, films in date_map.items()
+    }
     
-    # JavaScript
-    theater_names = '", "'.join([info['name'] for info in THEATERS.values()])
+    # Grid View and List View share one renderer; only the wrapper markup differs
+    for view in ("grid", "list"):
+        yield from render_view(view, sorted_months, dates_by_month, day_blocks)
     
-    html_parts.append(f"""<script>
-const activeSources = new Set(["{theater_names}"]);
+    # JavaScript: filtering only toggles body classes; the CSS rules above
+    # hide the films, and days are hidden from their data-sources list
+    yield ("""<script>
+const hiddenTheaters = new Set();
 
-function updateFilters() {{
-  document.querySelectorAll('.film').forEach(film => {{
-    const source = film.getAttribute('data-source');
-    film.style.display = activeSources.has(source) ? 'flex' : 'none';
-  }});
-  
-  document.querySelectorAll('.day-box, .list-day').forEach(day => {{
-    const visible = Array.from(day.querySelectorAll('.film'))
-      .some(film => film.style.display !== 'none');
-    day.style.display = visible ? 'block' : 'none';
-  }});
-}}
-
-function toggleFilter(button) {{
-  const source = button.getAttribute('data-source');
+function updateDays() {
+  document.querySelectorAll('[data-sources]').forEach(day => {
+    const sources = day.dataset.sources.split(' ');
+    day.classList.toggle('hidden', sources.every(s => hiddenTheaters.has(s)));
+  });
+}
+
+function toggleFilter(button) {
+  const theater = button.dataset.theater;
+  const hide = !hiddenTheaters.has(theater);
   
-  if (activeSources.has(source)) {{
-    activeSources.delete(source);
-    button.classList.remove('active');
-    button.classList.add('inactive');
-  }} else {{
-    activeSources.add(source);
-    button.classList.add('active');
-    button.classList.remove('inactive');
-  }}
+  if (hide) {
+    hiddenTheaters.add(theater);
+  } else {
+    hiddenTheaters.delete(theater);
+  }
+  document.body.classList.toggle('hide-' + theater, hide);
+  button.classList.toggle('active', !hide);
+  button.classList.toggle('inactive', hide);
   
-  updateFilters();
-}}
+  updateDays();
+}
 
-function toggleView(viewId) {{
+function toggleView(viewId) {
   document.getElementById('grid-view').classList.add('hidden');
   document.getElementById('list-view').classList.add('hidden');
   document.getElementById(viewId).classList.remove('hidden');
-}}
+}
 
-window.onload = function() {{
-  document.querySelectorAll('.toggle').forEach(btn => {{
+window.onload = function() {
+  document.querySelectorAll('.toggle').forEach(btn => {
     btn.addEventListener('click', () => toggleFilter(btn));
-  }});
+  });
   
   toggleView('grid-view');
-  updateFilters();
-}}
+}
 </script>
 </body>
 </html>""")
     
-    return "\n".join(html_parts)
+
+
+def generate_html(date_map: Dict, sorted_months: List[Tuple], dates_by_month: Dict) -> str:
+    """Generate the complete HTML calendar as a single string."""
+    return "\n".join(iter_html_parts(date_map, sorted_months, dates_by_month))
+
+
+def write_html(date_map: Dict, sorted_months: List[Tuple], dates_by_month: Dict,
+               path: str = HTML_OUTPUT, content_hash: str = None) -> None:
+    """
+    Stream the HTML calendar to disk as it is generated.
+    
+    Writes the same content as generate_html() without ever holding the
+    whole document in memory, plus a gzipped copy (path + ".gz") in the same
+    pass for servers that can serve it pre-compressed.
+    """
+    parts = iter_html_parts(date_map, sorted_months, dates_by_month, content_hash)
+    # Binary mode: each part is UTF-8 encoded once and the same bytes go to
+    # both files, with no text-layer newline translation
+    with open(path, "wb", buffering=1 << 20) as f, \
+            gzip.open(f"{path}.gz", "wb", compresslevel=6) as gz:
+        data = next(parts, "").encode("utf-8")
+        f.write(data)
+        gz.write(data)
+        for part in parts:
+            data = b"\n" + part.encode("utf-8")
+            f.write(data)
+            gz.write(data)
+
+
+def calendar_hash(date_map: Dict) -> str:
+    """
+    Hash everything the written page depends on.
+    
+    That is the organized screenings (each already carries its rendered row,
+    so source, class and link are covered) in day order, plus this module's
+    own source so template changes still regenerate the page.
+    """
+    digest = hashlib.blake2b(Path(__file__).read_bytes())
+    for date_str, films in date_map.items():
+        digest.update(b"\0" + date_str.encode("utf-8"))
+        for film in films:
+            digest.update(b"\n" + film.row_html.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def read_calendar_hash(path: str = HTML_OUTPUT) -> str:
+    """Return the calendar_hash embedded in a written page ("" if none)."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            head = f.read(1024)
+    except OSError:
+        return ""
+    match = CALENDAR_HASH_PATTERN.search(head)
+    return match.group(1) if match else ""
 
 
 def main():
@@ -660,16 +809,19 @@ def main():
         return
         
     # Parse and organize (with time sorting!)
-    date_map, sorted_months = parse_and_organize_films(all_films)
+    date_map, sorted_months, dates_by_month = parse_and_organize_films(all_films)
     print(f"📆 Organized into {len(date_map)} days across {len(sorted_months)} months")
     print(f"✅ Films sorted chronologically within each day")
     
-    # Generate HTML
-    html = generate_html(date_map, sorted_months)
+    # Same screenings as the page on disk (whichever run or checkout wrote
+    # it): nothing to rewrite
+    content_hash = calendar_hash(date_map)
+    if content_hash == read_calendar_hash(HTML_OUTPUT):
+        print(f"⏭️ No changes since last run, keeping {HTML_OUTPUT}")
+        return
     
-    # Save output
-    with open(HTML_OUTPUT, "w", encoding="utf-8") as f:
-        f.write(html)
+    # Generate HTML straight to disk
+    write_html(date_map, sorted_months, dates_by_month, HTML_OUTPUT, content_hash)
         
     print(f"✅ Calendar saved to {HTML_OUTPUT}")
     
@@ -10,12 +10,21 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List, Dict
 
 from config import THEATERS, SCRAPE_SETTINGS
-from scrapers import SCRAPER_REGISTRY
+from scrapers import SCRAPER_REGISTRY, DriverPool
+from scrapers.base import clear_chrome_profiles
 from generator import main as generate_calendar
 
 
-def run_single_scraper(theater_id: str) -> Dict:
-    """Run a single scraper and return results."""
+def run_single_scraper(theater_id: str, pool: DriverPool = None, ndjson: bool = False) -> Dict:
+    """Run a single scraper and return results.
+
+    Args:
+        theater_id: Key into SCRAPER_REGISTRY
+        pool: Optional DriverPool; browser scrapers use its shared Chrome
+            instead of starting their own. A failed attempt resets the pool,
+            so retries (and later theaters) get a fresh browser
+        ndjson: Also stream films to data/<id>_films.ndjson as they are found
+    """
     if theater_id not in SCRAPER_REGISTRY:
         print(f"❌ Unknown theater: {theater_id}")
         return {"theater": theater_id, "success": False, "count": 0, "error": "Unknown theater"}
@@ -28,9 +37,15 @@ def run_single_scraper(theater_id: str) -> Dict:
     scraper_class = SCRAPER_REGISTRY[theater_id]
     
     for attempt in range(SCRAPE_SETTINGS["retry_attempts"]):
+        driver = None
+        if pool is not None and scraper_class.USES_BROWSER:
+            try:
+                driver = pool.driver()
+            except Exception as e:
+                print(f"⚠️ Could not start shared browser, scraper will start its own: {e}")
         try:
             scraper = scraper_class()
-            films = scraper.run()
+            films = scraper.run(driver=driver, ndjson=ndjson)
             return {
                 "theater": theater_id,
                 "success": True,
@@ -39,19 +54,28 @@ def run_single_scraper(theater_id: str) -> Dict:
             }
         except Exception as e:
             print(f"⚠️ [{theater_id}] Attempt {attempt + 1} failed: {e}")
+            if driver is not None:
+                # The shared browser may be what failed (crashed or wedged)
+                pool.reset()
             if attempt < SCRAPE_SETTINGS["retry_attempts"] - 1:
                 time.sleep(SCRAPE_SETTINGS["retry_delay"])
                 
     return {"theater": theater_id, "success": False, "count": 0, "error": str(e)}
 
 
-def run_scrapers_parallel(theater_ids: List[str], max_workers: int = 3) -> List[Dict]:
-    """Run multiple scrapers in parallel."""
+def run_scrapers_parallel(theater_ids: List[str], max_workers: int = None, ndjson: bool = False) -> List[Dict]:
+    """
+    Run multiple scrapers in parallel.
+    
+    Each scraper drives its own browser and spends nearly all of its time
+    waiting on the network, so by default one worker is used per theater and
+    the total time is roughly that of the slowest scraper.
+    """
     results = []
     
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+    with ThreadPoolExecutor(max_workers=max_workers or max(len(theater_ids), 1)) as executor:
         future_to_theater = {
-            executor.submit(run_single_scraper, tid): tid 
+            executor.submit(run_single_scraper, tid, None, ndjson): tid 
             for tid in theater_ids
         }
         
@@ -71,13 +95,18 @@ def run_scrapers_parallel(theater_ids: List[str], max_workers: int = 3) -> List[
     return results
 
 
-def run_scrapers_sequential(theater_ids: List[str]) -> List[Dict]:
-    """Run scrapers one at a time."""
+def run_scrapers_sequential(theater_ids: List[str], ndjson: bool = False) -> List[Dict]:
+    """Run scrapers one at a time, sharing a single Chrome between them.
+
+    Starting Chrome takes a second or two and a few hundred MB each time;
+    run back to back, the browser scrapers can simply take turns on one.
+    """
     results = []
     
-    for theater_id in theater_ids:
-        result = run_single_scraper(theater_id)
-        results.append(result)
+    with DriverPool() as pool:
+        for theater_id in theater_ids:
+            result = run_single_scraper(theater_id, pool, ndjson)
+            results.append(result)
         
     return results
 
@@ -127,8 +156,18 @@ def main():
     parser.add_argument(
         "--workers", "-w",
         type=int,
-        default=3,
-        help="Number of parallel workers (default: 3)"
+        default=None,
+        help="Number of parallel workers (default: one per theater)"
+    )
+    parser.add_argument(
+        "--ndjson",
+        action="store_true",
+        help="Also stream each theater's films to data/<id>_films.ndjson as they are found"
+    )
+    parser.add_argument(
+        "--fresh",
+        action="store_true",
+        help="Discard the saved Chrome profiles and start with a cold browser cache"
     )
     parser.add_argument(
         "--scrape-only", "-s",
@@ -164,13 +203,16 @@ def main():
     
     # Scrape phase
     if not args.generate_only:
+        if args.fresh:
+            clear_chrome_profiles()
+            print("🧹 Cleared saved Chrome profiles")
         print("🔍 Starting scrapers...")
         start_time = time.time()
         
         if args.parallel:
-            results = run_scrapers_parallel(theater_ids, args.workers)
+            results = run_scrapers_parallel(theater_ids, args.workers, args.ndjson)
         else:
-            results = run_scrapers_sequential(theater_ids)
+            results = run_scrapers_sequential(theater_ids, args.ndjson)
             
         elapsed = time.time() - start_time
         print_results_summary(results)
@@ -186,13 +228,23 @@ def main():
         try:
             import subprocess
             print("\n📤 Publishing to GitHub...")
-            subprocess.run(["git", "add", "index.html"], check=True)
-            subprocess.run(
-                ["git", "commit", "-m", "📅 Auto-update calendar"], 
-                check=True
-            )
-            subprocess.run(["git", "push"], check=True)
-            print("✅ Published to GitHub.")
+            # One status call shows whether index.html changed (staged or not)
+            # and whether anything else is already staged for the commit
+            status = subprocess.run(
+                ["git", "status", "--porcelain", "--untracked-files=no"],
+                capture_output=True, text=True, check=True
+            ).stdout.splitlines()
+            if not any(line[0] != " " or line[3:] == "index.html" for line in status):
+                print("📭 index.html unchanged, nothing to publish.")
+            else:
+                # --include stages index.html as part of the commit (no
+                # separate git add); anything already staged is committed too
+                subprocess.run(
+                    ["git", "commit", "-m", "📅 Auto-update calendar", "--include", "index.html"],
+                    check=True
+                )
+                subprocess.run(["git", "push"], check=True)
+                print("✅ Published to GitHub.")
         except subprocess.CalledProcessError:
             print("⚠️ Git push failed (may need manual commit)")
         except FileNotFoundError:
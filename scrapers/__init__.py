@@ -2,7 +2,10 @@
 Scrapers package - contains all theater-specific scrapers.
 """
 
-from .base import BaseScraper
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from .base import BaseScraper, DriverPool
 from .fox import FoxScraper
 from .paradise import ParadiseScraper
 from .revue import RevueScraper
@@ -18,12 +21,62 @@ SCRAPER_REGISTRY = {
     "kingsway": KingswayScraper,
 }
 
+
+def run_all(theater_ids=None):
+    """
+    Run scrapers one after another on a single shared Chrome.
+    
+    Args:
+        theater_ids: Registry keys to run (default: all of them)
+        
+    Returns:
+        Dict mapping each theater id to its scraped films
+    """
+    results = {}
+    with DriverPool() as pool:
+        for theater_id in theater_ids or SCRAPER_REGISTRY:
+            scraper_class = SCRAPER_REGISTRY[theater_id]
+            driver = pool.driver() if scraper_class.USES_BROWSER else None
+            results[theater_id] = scraper_class().run(driver=driver)
+    return results
+
+
+def _run_one(theater_id):
+    """Process-pool worker: run one scraper with its own browser."""
+    return SCRAPER_REGISTRY[theater_id]().run()
+
+
+def run_all_parallel(theater_ids=None, max_workers=None):
+    """
+    Run scrapers at the same time, one process per theater.
+    
+    Each scraper is independent and spends its time waiting on the network,
+    so the whole run takes about as long as the slowest one. Processes keep
+    each scraper's Chrome and WebDriver session fully separate.
+    
+    Args:
+        theater_ids: Registry keys to run (default: all of them)
+        max_workers: Process count (default: one per theater)
+        
+    Returns:
+        Dict mapping each theater id to its scraped films
+    """
+    theater_ids = list(theater_ids or SCRAPER_REGISTRY)
+    # Workers print emoji progress; make sure spawned interpreters can encode it
+    os.environ.setdefault("PYTHONIOENCODING", "utf-8")
+    with ProcessPoolExecutor(max_workers=max_workers or max(len(theater_ids), 1)) as executor:
+        return dict(zip(theater_ids, executor.map(_run_one, theater_ids)))
+
+
 __all__ = [
     "BaseScraper",
+    "DriverPool",
     "FoxScraper",
     "ParadiseScraper", 
     "RevueScraper",
     "TiffScraper",
     "KingswayScraper",
     "SCRAPER_REGISTRY",
+    "run_all",
+    "run_all_parallel",
 ]
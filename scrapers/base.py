@@ -17,15 +17,70 @@ from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException
+import functools
+import gzip
+import hashlib
 import json
+import shutil
+import subprocess
 import time
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Tuple
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
 import sys
 import io
 import os
 
+try:
+    import orjson  # optional: much faster JSON encode/decode
+except ImportError:
+    orjson = None
+
+# Resources no scraper reads; blocked at the network layer in setup_driver()
+BLOCKED_URL_PATTERNS = [
+    '*.jpg', '*.jpeg', '*.png', '*.gif', '*.webp', '*.svg', '*.ico',
+    '*.woff', '*.woff2', '*.ttf', '*.otf',
+    '*.mp4', '*.webm', '*.mp3',
+    # Analytics, ad and social-widget scripts
+    '*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*',
+    '*connect.facebook.net*',
+]
+
+# Number of elements matching the CSS selector passed as arguments[0]
+COUNT_MATCHES_JS = "return document.querySelectorAll(arguments[0]).length;"
+
+# Scroll to the bottom, nudge scroll listeners, and count as above
+SCROLL_AND_COUNT_JS = """
+window.scrollTo(0, document.body.scrollHeight);
+window.dispatchEvent(new Event('scroll'));
+return document.querySelectorAll(arguments[0]).length;
+"""
+
+# Click the element at XPath arguments[0], keeping a reference to it; returns
+# the page's element count before the click, or -1 if there is no such element
+CLICK_LOAD_MORE_JS = """
+const b = document.evaluate(arguments[0], document, null,
+    XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+if (!b) return -1;
+b.scrollIntoView({block: 'center'});
+const count = document.getElementsByTagName('*').length;
+window.__loadMoreButton = b;
+b.click();
+return count;
+"""
+
+# True once the clicked button is gone or the page has more elements than
+# the count passed as arguments[0]
+LOAD_MORE_SETTLED_JS = """
+return !document.contains(window.__loadMoreButton)
+    || document.getElementsByTagName('*').length > arguments[0];
+"""
+
+# Realistic Mac/Chrome user agent to pass Cloudflare bot checks
+USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36'
+
 # ============================================================
 # Windows Unicode/Emoji Fix
 # Prevents UnicodeEncodeError when printing emoji on Windows
@@ -57,9 +112,177 @@ if sys.platform == 'win32':
             pass
 
 
+# ============================================================
+# ChromeDriver path cache
+# Selenium Manager re-resolves the driver (and may check online for a new
+# version) on every launch; remember the resolved binary between runs.
+# ============================================================
+DRIVER_PATH_CACHE = Path.home() / '.cache' / 'movies_scraper' / 'chromedriver_path'
+DRIVER_PATH_MAX_AGE = 7 * 24 * 3600  # re-resolve weekly to pick up Chrome updates
+
+
+@functools.lru_cache(maxsize=1)
+def cached_driver_path():
+    """Return a known-good chromedriver path, or None to let Selenium resolve one.
+
+    Memoized so scrapers sharing a process resolve the path once.
+    """
+    env_path = os.environ.get('CHROMEDRIVER_PATH')
+    if env_path:
+        return env_path
+    try:
+        if time.time() - DRIVER_PATH_CACHE.stat().st_mtime > DRIVER_PATH_MAX_AGE:
+            return None
+        path = DRIVER_PATH_CACHE.read_text(encoding='utf-8').strip()
+    except OSError:
+        return None
+    return path if path and os.path.isfile(path) else None
+
+
+def remember_driver_path(path) -> None:
+    """Persist the driver path Selenium resolved for the next run."""
+    if not path or not os.path.isfile(path):
+        return
+    try:
+        DRIVER_PATH_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        DRIVER_PATH_CACHE.write_text(str(path), encoding='utf-8')
+    except OSError:
+        pass
+    cached_driver_path.cache_clear()
+
+
+def forget_driver_path() -> None:
+    """Drop a cached driver path that no longer works."""
+    try:
+        DRIVER_PATH_CACHE.unlink()
+    except OSError:
+        pass
+    cached_driver_path.cache_clear()
+
+
+# ============================================================
+# Date labels
+# Built from name tuples rather than strftime: no format-string parsing,
+# no locale dependence, and no zero-padded day to strip (or %-d, which
+# Windows lacks).
+# ============================================================
+DAY_NAMES = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+MONTH_NAMES = (
+    "", "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December",
+)
+
+
+def format_date(d) -> str:
+    """Format a date or datetime as "Monday, January 26"."""
+    return f"{DAY_NAMES[d.weekday()]}, {MONTH_NAMES[d.month]} {d.day}"
+
+
+# ============================================================
+# In-page extraction
+# Scrapers describe the rows they read (a root selector plus one field per
+# column) and get back a script that reads every row in one execute_script,
+# instead of several WebDriver calls per element.
+# ============================================================
+
+@functools.lru_cache(maxsize=None)
+def extractor_js(root: str, fields: Tuple) -> str:
+    """
+    Build a script returning one list per element matching `root`.
+    
+    Args:
+        root: CSS selector for the rows
+        fields: Tuple of (selector, property) or (selector, property, True)
+            per column. The property is read from the row's first match of
+            selector ("" if none); with True it is read from every match and
+            the column is a list. Text properties (innerText, textContent)
+            are trimmed.
+            
+    Returns:
+        str: JavaScript for driver.execute_script (cached per spec)
+    """
+    columns = []
+    for selector, prop, *many in fields:
+        read = f"e[{json.dumps(prop)}]"
+        if prop in ('innerText', 'textContent'):
+            read = f"(e[{json.dumps(prop)}] || '').trim()"
+        if many and many[0]:
+            columns.append(f"Array.from(b.querySelectorAll({json.dumps(selector)})).map(e => {read})")
+        else:
+            columns.append(f"(e => e ? {read} || '' : '')(b.querySelector({json.dumps(selector)}))")
+    return (
+        f"return Array.from(document.querySelectorAll({json.dumps(root)})).map(b => [\n    "
+        + ",\n    ".join(columns)
+        + "\n]);"
+    )
+
+
+# ============================================================
+# Persistent Chrome profiles
+# One user-data-dir per profile name (a theater id, or 'shared' for the
+# DriverPool browser), since two running Chromes cannot share one.
+# ============================================================
+CHROME_PROFILE_DIR = DRIVER_PATH_CACHE.parent / 'chrome-profiles'
+CHROME_DISK_CACHE_SIZE = 100 * 1024 * 1024
+
+
+def clear_chrome_profiles() -> None:
+    """Delete the saved Chrome profiles so the next browsers start cold."""
+    shutil.rmtree(CHROME_PROFILE_DIR, ignore_errors=True)
+
+
+# ============================================================
+# HTTP response cache
+# Pages fetched with fetch_html() are kept on disk with their ETag /
+# Last-Modified validators, so unchanged pages come back as a bodiless 304.
+# ============================================================
+HTTP_CACHE_DIR = DRIVER_PATH_CACHE.parent / 'http'
+
+
+def _http_cache_paths(url: str):
+    """Return (body_path, meta_path) for a cached URL."""
+    key = hashlib.blake2b(url.encode('utf-8'), digest_size=16).hexdigest()
+    return HTTP_CACHE_DIR / f'{key}.body', HTTP_CACHE_DIR / f'{key}.json'
+
+
+def _load_cached_response(url: str):
+    """Return (body_bytes, validators) for a cached URL, or (None, {})."""
+    body_path, meta_path = _http_cache_paths(url)
+    try:
+        validators = json.loads(meta_path.read_text(encoding='utf-8'))
+        return body_path.read_bytes(), validators
+    except (OSError, ValueError):
+        return None, {}
+
+
+def _store_cached_response(url: str, body: bytes, validators: Dict) -> None:
+    """Cache a response body if the server gave us something to revalidate with."""
+    if not validators:
+        return
+    body_path, meta_path = _http_cache_paths(url)
+    try:
+        HTTP_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        body_path.write_bytes(body)
+        meta_path.write_text(json.dumps(validators), encoding='utf-8')
+    except OSError:
+        pass
+
+
 class BaseScraper:
     """Base class for all theater scrapers."""
     
+    # Scrapers whose listings are in the server-rendered HTML set this to False:
+    # run() then skips Chrome entirely and scrape() reads pages via fetch_html().
+    USES_BROWSER = True
+    
+    # CSS selector that is present once the page's listings have rendered;
+    # load_page() polls for it instead of sleeping a fixed settle time
+    PRIMARY_SELECTOR = None
+    
+    # Named CSS selectors for this theater's page; locate() turns them into
+    # Selenium locators
+    SELECTORS = {}
+    
     def __init__(self, theater_id: str, theater_name: str, theater_url: str):
         """
         Initialize base scraper.
@@ -74,15 +297,44 @@ class BaseScraper:
         self.theater_url = theater_url
         self.url = theater_url  # backward-compat alias used by older scrapers
         self.driver = None
+        self._owns_driver = True
         self.films = []
+        # (title, showtime) of every film added through add_film*, so repeats
+        # are dropped without each scraper tracking its own
+        self._film_keys = set()
         
         # Set output file path: data/{theater_id}_films.json
         self.output_file = Path('data') / f'{theater_id}_films.json'
         
+        # Optional newline-delimited stream of films as they are found
+        # (data/{theater_id}_films.ndjson, see run(ndjson=True))
+        self.ndjson_file = self.output_file.with_suffix('.ndjson')
+        self._ndjson = None
+        self._ndjson_films = []
+        
         # Ensure data directory exists
         self.output_file.parent.mkdir(parents=True, exist_ok=True)
     
-    def setup_driver(self):
+    def extract(self, root: str, fields: Tuple) -> List[List]:
+        """Read every row matching root in one call (see extractor_js())."""
+        return self.driver.execute_script(extractor_js(root, fields))
+    
+    @classmethod
+    def locate(cls, name: str) -> Tuple[str, str]:
+        """
+        Return the (By.CSS_SELECTOR, selector) locator for a named selector.
+        
+        The locator tuples are built once per scraper class, on first use,
+        rather than on every find_element / wait call.
+        """
+        locators = cls.__dict__.get('_locators')
+        if locators is None:
+            locators = {key: (By.CSS_SELECTOR, selector) for key, selector in cls.SELECTORS.items()}
+            cls._locators = locators
+        return locators[name]
+    
+    @classmethod
+    def setup_driver(cls, profile: str = 'shared'):
         """
         Set up Chrome WebDriver with complete output suppression for Windows.
         
@@ -92,11 +344,16 @@ class BaseScraper:
         - Prevents Unicode decode errors on Windows
         - Works with Python 3.13+
         
+        A classmethod so one driver can be started up front and shared by
+        several scrapers (see run()).
+        
+        Args:
+            profile: Name of the persistent Chrome profile to use; browsers
+                running at the same time need different profiles
+        
         Returns:
             WebDriver: Configured Chrome WebDriver instance
         """
-        import subprocess
-        
         options = webdriver.ChromeOptions()
         
         # Headless mode configuration
@@ -118,25 +375,59 @@ class BaseScraper:
         options.add_argument('--disable-background-networking')
         options.add_argument('--disable-features=VizDisplayCompositor')
         
+        # Don't fetch or decode images - scrapers only read DOM text and attributes
+        options.add_argument('--blink-settings=imagesEnabled=false')
+        options.add_experimental_option('prefs', {
+            'profile.managed_default_content_settings.images': 2,
+            'profile.default_content_setting_values.notifications': 2,
+        })
+        
         # Set user agent (realistic Mac/Chrome to pass Cloudflare bot checks)
-        options.add_argument('--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36')
+        options.add_argument(f'--user-agent={USER_AGENT}')
+        
+        # Keep the profile between runs so Chrome's disk cache (scripts,
+        # stylesheets) is warm; clear_chrome_profiles() resets it
+        profile_dir = CHROME_PROFILE_DIR / profile
+        profile_dir.mkdir(parents=True, exist_ok=True)
+        profile_arg = f'--user-data-dir={profile_dir.resolve()}'
+        options.add_argument(profile_arg)
+        options.add_argument(f'--disk-cache-size={CHROME_DISK_CACHE_SIZE}')
+        
+        # driver.get() returns at DOMContentLoaded instead of waiting for every
+        # subresource; load_page() then waits for the content it needs
+        options.page_load_strategy = 'eager'
         
         # Windows-specific encoding
         if sys.platform == 'win32':
             os.environ['PYTHONIOENCODING'] = 'utf-8'
         
         try:
-            # Create service with output redirection
-            service = webdriver.ChromeService(log_path=os.devnull)
-            
-            # Windows-specific: Suppress subprocess window
-            if sys.platform == 'win32':
-                # Hide the ChromeDriver console window
-                CREATE_NO_WINDOW = 0x08000000
-                service.creation_flags = CREATE_NO_WINDOW
+            driver_path = cached_driver_path()
+            driver = None
+            try:
+                driver = cls._start_chrome(options, driver_path)
+            except Exception:
+                if driver_path:
+                    # Cached driver no longer matches the installed Chrome: re-resolve
+                    print("⚠️  Cached ChromeDriver failed to start, re-resolving...")
+                    forget_driver_path()
+                    try:
+                        driver = cls._start_chrome(options, None)
+                    except Exception:
+                        pass
+            if driver is None:
+                # The profile is most likely in use by another run's Chrome
+                # (say a cron run overlapping a manual one): start without it,
+                # on the throwaway profile ChromeDriver creates and removes
+                print(f"⚠️  Chrome failed to start with profile '{profile}', retrying with a temporary profile...")
+                options.arguments.remove(profile_arg)
+                driver = cls._start_chrome(options, None)
             
-            driver = webdriver.Chrome(service=service, options=options)
             driver.set_page_load_timeout(30)
+            # Skip image/font/media downloads entirely (stylesheets are kept:
+            # infinite-scroll pages need real layout to trigger loading)
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
             # Mask navigator.webdriver to pass Cloudflare bot checks
             driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {
                 'source': "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
@@ -147,30 +438,63 @@ class BaseScraper:
             print(f"❌ Error setting up Chrome driver: {e}")
             raise
     
-    def load_page(self, url: str = None) -> bool:
+    @staticmethod
+    def _start_chrome(options, driver_path: str = None):
+        """Start Chrome with the given driver binary (None = let Selenium Manager resolve it)."""
+        # Send ChromeDriver's stdout/stderr straight to the null device; a path
+        # (os.devnull) would instead be passed as --log-path and still formatted
+        service = webdriver.ChromeService(executable_path=driver_path, log_output=subprocess.DEVNULL)
+        
+        # Windows-specific: Suppress subprocess window
+        if sys.platform == 'win32':
+            # Hide the ChromeDriver console window
+            CREATE_NO_WINDOW = 0x08000000
+            service.creation_flags = CREATE_NO_WINDOW
+        
+        driver = webdriver.Chrome(service=service, options=options)
+        if not driver_path:
+            remember_driver_path(getattr(service, 'path', None))
+        return driver
+    
+    def load_page(self, url: str = None, ready_selector: str = None) -> bool:
         """
         Load a page and wait for it to be ready.
         
         Args:
             url: URL to load (default: self.theater_url)
+            ready_selector: CSS selector whose presence means the content is
+                rendered (default: PRIMARY_SELECTOR). Without one, a short
+                fixed settle is used instead.
             
         Returns:
             bool: True if page loaded successfully, False otherwise
         """
         if url is None:
             url = self.theater_url
+        if ready_selector is None:
+            ready_selector = self.PRIMARY_SELECTOR
         
         try:
             print(f"📄 Loading page: {url}")
+            # Returns at DOMContentLoaded (eager page load strategy)
             self.driver.get(url)
             
-            # Wait for body element to be present
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
-            )
-            
-            # Small delay to let JavaScript render
-            time.sleep(2)
+            if ready_selector:
+                # Poll for the content itself rather than for the load event or
+                # a fixed time; if it never shows up, let scrape() find the page empty
+                try:
+                    WebDriverWait(self.driver, 10, poll_frequency=0.1).until(
+                        lambda d: d.execute_script("return !!document.querySelector(arguments[0]);", ready_selector)
+                    )
+                except TimeoutException:
+                    print(f"⚠️  No '{ready_selector}' on page after load")
+            else:
+                # Nothing specific to look for: wait for the load event, then
+                # a short settle for client-side rendering
+                WebDriverWait(self.driver, 10, poll_frequency=0.2).until(
+                    lambda d: d.execute_script("return document.readyState") == "complete"
+                )
+                time.sleep(0.5)
             
             print(f"✅ Page loaded successfully")
             return True
@@ -182,6 +506,52 @@ class BaseScraper:
             print(f"❌ Error loading page: {e}")
             return False
     
+    def fetch_html(self, url: str = None, timeout: int = 30) -> str:
+        """
+        Fetch a page's server-rendered HTML over plain HTTP (no browser).
+        
+        Revalidates against the on-disk HTTP cache: when the server answers
+        304 Not Modified, the cached body is reused instead of re-downloaded.
+        
+        Args:
+            url: URL to fetch (default: self.theater_url)
+            timeout: Socket timeout in seconds
+            
+        Returns:
+            str: Decoded page source
+        """
+        if url is None:
+            url = self.theater_url
+        
+        # Ask for a compressed body - listing pages are large and highly compressible
+        headers = {'User-Agent': USER_AGENT, 'Accept-Encoding': 'gzip'}
+        cached_body, cached_validators = _load_cached_response(url)
+        if cached_body is not None:
+            if cached_validators.get('etag'):
+                headers['If-None-Match'] = cached_validators['etag']
+            if cached_validators.get('last_modified'):
+                headers['If-Modified-Since'] = cached_validators['last_modified']
+        
+        try:
+            with urlopen(Request(url, headers=headers), timeout=timeout) as r:
+                body = r.read()
+                if r.headers.get('Content-Encoding', '').lower() == 'gzip':
+                    body = gzip.decompress(body)
+                validators = {
+                    key: value for key, value in (
+                        ('etag', r.headers.get('ETag')),
+                        ('last_modified', r.headers.get('Last-Modified')),
+                    ) if value
+                }
+        except HTTPError as e:
+            if e.code != 304 or cached_body is None:
+                raise
+            print(f"♻️  Not modified, using cached copy: {url}")
+            return cached_body.decode('utf-8', errors='ignore')
+        
+        _store_cached_response(url, body, validators)
+        return body.decode('utf-8', errors='ignore')
+    
     def wait_for_element(self, by: By, value: str, timeout: int = 10):
         """
         Wait for an element to be present on the page.
@@ -217,8 +587,25 @@ class BaseScraper:
             data = self.films
         
         try:
-            with open(self.output_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            if orjson is not None:
+                # Same bytes as json.dump(indent=2, ensure_ascii=False), much faster
+                payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+            else:
+                payload = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+            
+            # Leave an identical file untouched so its mtime (and the deploy's
+            # data hash) only changes when the listings actually do
+            try:
+                if self.output_file.read_bytes() == payload:
+                    print(f"💾 {self.output_file} unchanged ({len(data)} films)")
+                    return True
+            except OSError:
+                pass
+            
+            # Write to a temp file and swap it in, so readers never see a partial file
+            tmp_file = self.output_file.with_suffix('.json.tmp')
+            tmp_file.write_bytes(payload)
+            os.replace(tmp_file, self.output_file)
             
             print(f"💾 Saved {len(data)} films to {self.output_file}")
             return True
@@ -228,8 +615,8 @@ class BaseScraper:
             return False
     
     def cleanup(self):
-        """Close the browser and clean up resources."""
-        if self.driver:
+        """Close the browser and clean up resources (a shared driver is left open)."""
+        if self.driver and self._owns_driver:
             try:
                 self.driver.quit()
                 print(f"🌐 Browser closed")
@@ -250,14 +637,18 @@ class BaseScraper:
         raise NotImplementedError("Subclasses must implement scrape() method")
     
     def scroll_to_load_all(self, item_selector: str, max_attempts: int = 25, wait_s: float = 1.5) -> None:
-        """Scroll down until the number of elements matching item_selector stops increasing."""
-        import time
+        """Scroll down until the number of elements matching item_selector stops increasing.
+
+        After each scroll, waits up to wait_s for new items to appear instead of
+        always sleeping the full interval.
+        """
         last_count = -1
         stable = 0
         for _ in range(max_attempts):
             try:
-                items = self.driver.find_elements(By.CSS_SELECTOR, item_selector)
-                count = len(items)
+                # Scroll and count in one round trip (counting in-page: no
+                # WebElement handles to serialize over the wire)
+                count = self.driver.execute_script(SCROLL_AND_COUNT_JS, item_selector)
                 print(f"🔄 [{self.theater_name}] {count} items loaded...")
                 if count == last_count:
                     stable += 1
@@ -268,30 +659,52 @@ class BaseScraper:
                 if stable >= 3:
                     break
 
-                self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(wait_s)
+                try:
+                    WebDriverWait(self.driver, wait_s, poll_frequency=0.2).until(
+                        lambda d: d.execute_script(COUNT_MATCHES_JS, item_selector) > count
+                    )
+                except TimeoutException:
+                    pass
             except Exception:
                 time.sleep(wait_s)
         print(f"✅ [{self.theater_name}] Finished scrolling, {max(last_count,0)} items found.")
 
     def click_load_more(self, load_more_xpath: str, max_clicks: int = 10, wait_s: float = 1.2) -> None:
-        """Click a 'Load More' element repeatedly until it disappears."""
-        import time
+        """Click a 'Load More' element repeatedly until it disappears.
+
+        After each click, waits up to wait_s for the button to be replaced or for
+        new nodes to be added to the page rather than sleeping a fixed interval.
+        """
         for i in range(max_clicks):
             try:
-                btn = self.driver.find_element(By.XPATH, load_more_xpath)
-                self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", btn)
-                time.sleep(0.3)
-                btn.click()
+                # Find, scroll to and click the button in one round trip; a
+                # missing button ends the loop without a NoSuchElement error
+                node_count = self.driver.execute_script(CLICK_LOAD_MORE_JS, load_more_xpath)
+                if node_count < 0:
+                    break
                 print(f"🔄 [{self.theater_name}] Clicked 'Load More' ({i+1})")
-                time.sleep(wait_s)
+                try:
+                    WebDriverWait(self.driver, wait_s, poll_frequency=0.2).until(
+                        lambda d: d.execute_script(LOAD_MORE_SETTLED_JS, node_count)
+                    )
+                except TimeoutException:
+                    pass
             except Exception:
                 break
 
-    def run(self) -> List[Dict]:
+    def run(self, driver=None, ndjson: bool = False) -> List[Dict]:
         """
         Complete scraping workflow: setup → scrape → save → cleanup.
         
+        Args:
+            driver: Optional already-running WebDriver to use instead of
+                starting a new Chrome; the caller keeps ownership and quits it
+            ndjson: Also write each film to ndjson_file, one JSON object per
+                line, as soon as it is added (films a scraper builds without
+                add_film() are written when scrape() returns). The lines go
+                to a temporary file that only replaces ndjson_file when the
+                scrape succeeds, like the JSON output.
+        
         Returns:
             List[Dict]: List of scraped films
         """
@@ -299,21 +712,41 @@ class BaseScraper:
         print(f"📋 Scraping {self.theater_name.upper()}")
         print("="*60)
         
+        ndjson_tmp = self.ndjson_file.with_suffix('.ndjson.tmp')
+        ndjson_done = False
         try:
-            # Setup
-            self.driver = self.setup_driver()
+            if ndjson:
+                self._ndjson = open(ndjson_tmp, 'wb')
+                self._ndjson_films = []
             
-            # Load page
-            if not self.load_page():
-                print(f"❌ Failed to load page")
-                return []
+            if self.USES_BROWSER:
+                # Setup
+                self._owns_driver = driver is None
+                self.driver = driver or self.setup_driver(self.theater_id)
+                
+                # Load page
+                if not self.load_page():
+                    print(f"❌ Failed to load page")
+                    return []
             
             # Scrape (implemented by subclass)
             self.films = self.scrape()
             
+            if self._ndjson:
+                streamed = self._ndjson_films
+                if not all(a is b for a, b in zip(self.films, streamed)) or len(self.films) < len(streamed):
+                    # scrape() returned something other than the films it
+                    # streamed (e.g. TIFF keeping its saved dataset): start over
+                    self._ndjson.seek(0)
+                    self._ndjson.truncate()
+                    self._ndjson_films = []
+                for film in self.films[len(self._ndjson_films):]:
+                    self._write_ndjson(film)
+            
             # Save results
             if self.films:
                 self.save_to_json()
+                ndjson_done = self._ndjson is not None
                 print(f"✅ Successfully scraped {len(self.films)} films")
             else:
                 print(f"⚠️  No films found")
@@ -327,22 +760,61 @@ class BaseScraper:
             return []
             
         finally:
+            if self._ndjson:
+                self._ndjson.close()
+                self._ndjson = None
+                # Only a complete scrape replaces the previous stream
+                if ndjson_done:
+                    os.replace(ndjson_tmp, self.ndjson_file)
+                else:
+                    ndjson_tmp.unlink(missing_ok=True)
             # Always cleanup
             self.cleanup()
     
+    def _write_ndjson(self, film: Dict) -> None:
+        """Append one film to the open NDJSON stream."""
+        if orjson is not None:
+            line = orjson.dumps(film)
+        else:
+            line = json.dumps(film, ensure_ascii=False).encode('utf-8')
+        self._ndjson.write(line + b"\n")
+        self._ndjson_films.append(film)
+    
     def add_film(self, title: str, showtime: str, link: str = "") -> None:
         """Back-compat helper used by existing scrapers.
 
-        Appends a film/screening dict to self.films.
+        Appends a film/screening dict to self.films, unless a film with the
+        same title and showtime was already added (see add_film_record).
         """
         if not title:
             return
-        self.films.append({
+        self.add_film_record({
             "title": title.strip(),
             "showtime": showtime.strip() if showtime else "",
             "link": link.strip() if link else self.url,
             "source": self.theater_name,
         })
+    
+    def add_film_record(self, film: Dict) -> bool:
+        """
+        Append an already-built film dict to self.films.
+        
+        A film with the same title and showtime as one already added this
+        way is dropped (even if its link differs), so scrapers need no
+        duplicate tracking of their own. Films appended to self.films
+        directly are not checked.
+        
+        Returns:
+            bool: True if the film was new
+        """
+        key = (film.get('title', ''), film.get('showtime', ''))
+        if key in self._film_keys:
+            return False
+        self._film_keys.add(key)
+        self.films.append(film)
+        if self._ndjson:
+            self._write_ndjson(film)
+        return True
 
     def format_showtime(self, date: str, time: str) -> str:
         """
@@ -405,11 +877,79 @@ class BaseScraper:
             return default
 
 
+class DriverPool:
+    """
+    One Chrome shared by every browser scraper in a run.
+    
+    Chrome is started on the first driver() call, so a run of HTTP-only
+    scrapers never launches it, and quit when the `with` block exits.
+    Scrapers handed the driver through run(driver=...) leave it open.
+    
+    Usage:
+        with DriverPool() as pool:
+            for scraper in scrapers:
+                scraper.run(driver=pool.driver() if scraper.USES_BROWSER else None)
+    """
+    
+    def __init__(self):
+        self._driver = None
+        
+    def driver(self):
+        """Return the shared WebDriver, starting Chrome if needed."""
+        if self._driver is None:
+            self._driver = BaseScraper.setup_driver()
+        return self._driver
+        
+    def reset(self):
+        """Drop the shared browser; the next driver() call starts a fresh Chrome."""
+        self.close()
+        
+    def close(self):
+        """Quit the shared browser, if one was started."""
+        if self._driver is not None:
+            try:
+                self._driver.quit()
+            except Exception:
+                pass
+            self._driver = None
+            
+    def __enter__(self):
+        return self
+        
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
 # ============================================================
 # Standalone Helper Functions
 # (For backward compatibility with existing scrapers)
 # ============================================================
 
+def safe_find(element, selector: str):
+    """
+    Safely find a child element.
+    
+    Look the child up once with this when several of its properties are
+    needed, instead of calling safe_find_text/safe_find_attr for each.
+    
+    Args:
+        element: Parent element to search within
+        selector: CSS selector for child element
+        
+    Returns:
+        WebElement or None if not found
+    """
+    try:
+        if element is None:
+            return None
+        # An empty find_elements result avoids the error round-trip and
+        # exception of a failed find_element
+        matches = element.find_elements(By.CSS_SELECTOR, selector)
+        return matches[0] if matches else None
+    except Exception:
+        return None
+
+
 def safe_find_text(element, selector: str, default: str = "") -> str:
     """
     Safely find and extract text from a child element.
@@ -422,16 +962,7 @@ def safe_find_text(element, selector: str, default: str = "") -> str:
     Returns:
         str: Element text or default value
     """
-    try:
-        if element is None:
-            return default
-        child = element.find_element(By.CSS_SELECTOR, selector)
-        text = child.text.strip()
-        return text if text else default
-    except NoSuchElementException:
-        return default
-    except Exception:
-        return default
+    return safe_find_text_and_attr(element, selector, None, default)[0]
 
 
 def safe_find_attr(element, selector: str, attribute: str, default: str = "") -> str:
@@ -447,18 +978,43 @@ def safe_find_attr(element, selector: str, attribute: str, default: str = "") ->
     Returns:
         str: Attribute value or default value
     """
+    child = safe_find(element, selector)
+    if child is None:
+        return default
     try:
-        if element is None:
-            return default
-        child = element.find_element(By.CSS_SELECTOR, selector)
         value = child.get_attribute(attribute)
         return value if value else default
-    except NoSuchElementException:
-        return default
     except Exception:
         return default
 
 
+def safe_find_text_and_attr(element, selector: str, attribute: str, default: str = "") -> Tuple[str, str]:
+    """
+    Safely find a child element and get both its text and an attribute.
+    
+    One element lookup for the common "link text + href" pair, where
+    safe_find_text() followed by safe_find_attr() would search twice.
+    
+    Args:
+        element: Parent element to search within
+        selector: CSS selector for child element
+        attribute: Attribute name to get (e.g., "href"); None to skip it
+        default: Default for either value if missing or empty
+        
+    Returns:
+        Tuple[str, str]: (text, attribute value)
+    """
+    child = safe_find(element, selector)
+    if child is None:
+        return default, default
+    try:
+        text = child.text.strip()
+        value = child.get_attribute(attribute) if attribute else None
+    except Exception:
+        return default, default
+    return text or default, value or default
+
+
 # ============================================================
 # Example usage / testing
 # ============================================================
@@ -1,61 +1,190 @@
 """
 Fox Theatre scraper - handles infinite scroll page.
+
+The now-showing listing needs the browser (infinite scroll); each movie page's
+showtimes are then fetched over plain HTTP, falling back to the browser only
+when the server-rendered HTML has no showtime items.
 """
 
-from collections import Counter, defaultdict
-from datetime import datetime
-from selenium.webdriver.common.by import By
-from .base import BaseScraper, safe_find_text, safe_find_attr
+import re
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from html.parser import HTMLParser
+from urllib.parse import urljoin
+from .base import BaseScraper
 
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from config import THEATERS
 
+# Time pattern: "7:00 pm", "12:30PM", etc.
+TIME_PATTERN = re.compile(r'\d{1,2}:\d{2}\s*(?:am|pm)', re.IGNORECASE)
+
+# A showtime item's date: "Monday, July 20", "Fri Oct 16"
+DATE_PATTERN = re.compile(r'[A-Za-z]+,?\s+[A-Za-z]+\.?\s+\d{1,2}')
+
+# [title, href] for every Elementor container on the now-showing page
+MOVIE_LINKS = ("div[data-element_type='container']", (
+    ("h4.elementor-heading-title", "innerText"),
+    ("a[href*='/movies/']", "href"),
+))
+
+# Movie pages fetched over HTTP at once; small enough to stay polite to one site
+HTTP_WORKERS = 6
+
+# [date, time, ticket_href] for every showtime item on a rendered movie page
+SHOWTIME_ITEMS = (".showtimes-lists .item", (
+    ("span.date", "innerText"),
+    ("span.time", "innerText"),
+    ("a[href*='ticketsearchcriteria.aspx']", "href"),
+))
+
+
+class ShowtimeItemsParser(HTMLParser):
+    """Collect [date, time, ticket_href] for each `.showtimes-lists .item`.
+
+    Movie pages are server-rendered, so this reads the same fields the browser
+    path reads (span.date, span.time, the ticketsearchcriteria.aspx link)
+    straight from the HTML.
+    """
+
+    VOID_TAGS = {'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input',
+                 'link', 'meta', 'source', 'track', 'wbr'}
+
+    def __init__(self):
+        super().__init__()
+        self.items = []
+        self._depth = 0
+        # The list's own tag and how many of those are open inside it: the
+        # list ends when that count closes, however many stray unclosed tags
+        # (a <p> or <li>) its items leave behind
+        self._lists_tag = None
+        self._lists_open = 0
+        self._field = None
+        self._field_depth = None
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self.VOID_TAGS:
+            return
+        self._depth += 1
+        attrs = dict(attrs)
+        classes = (attrs.get('class') or '').split()
+
+        if self._lists_tag is None:
+            if 'showtimes-lists' in classes:
+                self._lists_tag, self._lists_open = tag, 1
+            return
+        if tag == self._lists_tag:
+            self._lists_open += 1
+        if 'item' in classes:
+            # Every .item opens a new entry, even if the previous one left a
+            # tag (an unclosed <p> or <li>) open and so never "ended"
+            self.items.append(['', '', ''])
+            self._field = self._field_depth = None
+        elif not self.items:
+            return
+        elif tag == 'span' and ('date' in classes or 'time' in classes):
+            self._field = 0 if 'date' in classes else 1
+            self._field_depth = self._depth
+        elif tag == 'a' and 'ticketsearchcriteria.aspx' in (attrs.get('href') or ''):
+            if not self.items[-1][2]:
+                self.items[-1][2] = attrs['href']
+
+    def handle_data(self, data):
+        if self._field is not None:
+            self.items[-1][self._field] += data
+
+    def handle_endtag(self, tag):
+        if tag in self.VOID_TAGS:
+            return
+        if self._depth == self._field_depth or tag == 'span':
+            self._field = self._field_depth = None
+        if tag == self._lists_tag:
+            self._lists_open -= 1
+            if not self._lists_open:
+                self._lists_tag = None
+                self._field = self._field_depth = None
+        self._depth -= 1
+
 
 class FoxScraper(BaseScraper):
     """Scraper for Fox Theatre (foxtheatre.ca)"""
     
+    PRIMARY_SELECTOR = "a[href*='/movies/']"
+    
     def __init__(self):
         config = THEATERS["fox"]
         super().__init__("fox", config["name"], config["url"])
 
     def _movie_links(self):
-        """Collect unique movie detail links from the now-showing page."""
+        """Collect unique movie detail links from the now-showing page.
+
+        Titles and links are read in-page with one script call rather than two
+        WebDriver lookups per container.
+        """
         links = {}
-        blocks = self.driver.find_elements(By.CSS_SELECTOR, "div[data-element_type='container']")
+        blocks = self.extract(*MOVIE_LINKS)
         print(f"🔍 [{self.theater_name}] Checking {len(blocks)} containers")
-        for block in blocks:
-            title = safe_find_text(block, "h4.elementor-heading-title")
-            link = safe_find_attr(block, "a[href*='/movies/']", "href")
+        for title, link in blocks:
             if not title or not link:
                 continue
             links[link] = title.strip()
         print(f"🎬 [{self.theater_name}] Found {len(links)} unique movie pages")
         return links
 
-    def _scrape_movie_page(self, title, link):
+    def _fetch_showtime_items(self, link):
+        """Read a movie page's showtimes over plain HTTP (no browser round trips)."""
+        try:
+            html = self.fetch_html(link)
+        except Exception as e:
+            print(f"⚠️  [{self.theater_name}] HTTP fetch failed for {link}: {e}")
+            return []
+
+        # Only the showtimes block matters: skip the header/nav markup before it
+        # rather than tokenizing the whole page.
+        start = html.find('showtimes-lists')
+        if start == -1:
+            return []
+        parser = ShowtimeItemsParser()
+        parser.feed(html[html.rfind('<', 0, start):])
+        parser.close()
+        items = [
+            (" ".join(raw_date.split()), " ".join(raw_time.split()), urljoin(link, href) if href else "")
+            for raw_date, raw_time, href in parser.items
+        ]
+        # Markup the parser misread (two items' fields run together, a date
+        # without its time) means the browser should read this page instead
+        for raw_date, raw_time, _ in items:
+            if (raw_date or raw_time) and not (DATE_PATTERN.fullmatch(raw_date) and TIME_PATTERN.fullmatch(raw_time)):
+                print(f"⚠️  [{self.theater_name}] Unexpected showtime markup on {link}: '{raw_date}' / '{raw_time}'")
+                return []
+        return items
+
+    def _browser_showtime_items(self, link):
+        """Fallback: render the movie page in Chrome and read the showtime items.
+
+        All items are read in-page with one script call rather than three
+        WebDriver lookups per item.
+        """
+        if not self.load_page(link, ready_selector=".showtimes-lists"):
+            return []
+        return self.extract(*SHOWTIME_ITEMS)
+
+    def _scrape_movie_page(self, title, link, items=None):
         films = []
-        if not self.load_page(link):
-            return films
+        if items is None:
+            items = self._fetch_showtime_items(link)
+        if not items:
+            # Nothing in the server-rendered HTML; the page may need JavaScript
+            items = self._browser_showtime_items(link)
 
-        items = self.driver.find_elements(By.CSS_SELECTOR, ".showtimes-lists .item")
-        seen = set()
-        for item in items:
-            raw_date = safe_find_text(item, "span.date")
-            raw_time = safe_find_text(item, "span.time")
-            ticket_link = safe_find_attr(item, "a[href*='ticketsearchcriteria.aspx']", "href") or link
+        for raw_date, raw_time, ticket_link in items:
+            ticket_link = ticket_link or link
 
             if not raw_date or not raw_time:
                 continue
-            if ":" not in raw_time or not ("am" in raw_time.lower() or "pm" in raw_time.lower()):
+            if not TIME_PATTERN.search(raw_time):
                 continue
 
             showtime = f"{raw_date.strip()}, {raw_time.strip()}"
-            key = (title, showtime)
-            if key in seen:
-                continue
-            seen.add(key)
             films.append({
                 "title": title,
                 "showtime": showtime,
@@ -69,17 +198,23 @@ class FoxScraper(BaseScraper):
         self.scroll_to_load_all("a[href*='/movies/']")
         movie_links = self._movie_links()
 
-        all_films = []
-        for idx, (link, title) in enumerate(movie_links.items(), start=1):
+        # Movie pages are independent HTTP GETs: fetch them concurrently, then
+        # fall back to the (single, shared) browser one page at a time
+        with ThreadPoolExecutor(max_workers=HTTP_WORKERS) as executor:
+            page_items = list(executor.map(self._fetch_showtime_items, movie_links))
+
+        for idx, ((link, title), items) in enumerate(zip(movie_links.items(), page_items), start=1):
             print(f"🔎 [{self.theater_name}] ({idx}/{len(movie_links)}) {title}")
-            all_films.extend(self._scrape_movie_page(title, link))
+            # add_film_record drops repeated showtimes
+            for film in self._scrape_movie_page(title, link, items):
+                self.add_film_record(film)
 
-        counts = Counter(x["title"] for x in all_films)
+        counts = Counter(x["title"] for x in self.films)
         for title, count in counts.most_common(10):
             if count > 20:
                 print(f"⚠️  [{self.theater_name}] High showtime count after movie-page scrape: {title} -> {count}")
 
-        return all_films
+        return self.films
 
 
 if __name__ == "__main__":
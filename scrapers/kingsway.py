@@ -5,13 +5,9 @@ in image attributes like: "Film Title Fri/Mon to Thurs 1:00 pm / daily 7:00 pm"
 """
 
 import re
-from datetime import datetime, timedelta
-from selenium.webdriver.common.by import By
-from .base import BaseScraper
+from datetime import date, datetime
+from .base import BaseScraper, format_date
 
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from config import THEATERS
 
 # Day name mappings
@@ -28,16 +24,56 @@ DAY_MAP = {
 # Time pattern: captures "1:00 pm", "7:00 PM", etc.
 TIME_PATTERN = re.compile(r'(\d{1,2}:\d{2}\s*(?:am|pm))', re.IGNORECASE)
 
+# Day names and abbreviations; full names are tried before their abbreviations
+DAY_NAME = r'(?:monday|tuesday|wednesday|thursday|friday|saturday|sunday|mon|tues?|wed|thu(?:rs?)?|fri|sat|sun)'
+
 # Day pattern: captures day names
-DAY_PATTERN = re.compile(r'\b(mon|tues?|wed|thurs?|fri|sat|sun|monday|tuesday|wednesday|thursday|friday|saturday|sunday)\b', re.IGNORECASE)
+DAY_PATTERN = re.compile(rf'\b({DAY_NAME})\b', re.IGNORECASE)
+
+# [alt or title text, href of the parent <a> or ""] for every image
+IMAGE_LISTINGS_JS = """
+return Array.from(document.images).map(img => {
+    const parent = img.parentElement;
+    return [
+        img.getAttribute("alt") || img.getAttribute("title") || "",
+        parent && parent.tagName === "A" ? parent.href : "",
+    ];
+});
+"""
+
+# Split schedule text on "/" only where a new time block starts ("daily" or
+# a time), so "Fri/Mon" stays together while "1:00 pm / daily 7:00 pm" splits
+SCHEDULE_SPLIT_PATTERN = re.compile(r'\s*/\s*(?=daily|\d{1,2}:\d{2})', re.IGNORECASE)
+
+# Day names joined by "/" ("Fri/Mon", "Sat/Sun": each of those days),
+# optionally followed by "to <day>" to make a range ("Fri/Mon to Thurs";
+# the end day is only peeked at, so it is still scanned as a day itself)
+SCHEDULE_DAYS_PATTERN = re.compile(
+    rf'(?P<days>{DAY_NAME}(?:\s*/\s*{DAY_NAME})*)(?:\b\s+to\s+(?=(?P<end>\w+)))?',
+    re.IGNORECASE
+)
+SLASH_PATTERN = re.compile(r'\s*/\s*')
+
+# Every weekday index, shared by all "daily" (or day-less) schedules
+ALL_DAYS = tuple(range(7))
+
+# Alt text of non-movie images (headers, logos, social links)
+SKIP_PATTERN = re.compile(r'kingsway theatre|twitter|facebook|logo|header', re.IGNORECASE)
+
+# "daily" keyword marking an every-day schedule
+DAILY_PATTERN = re.compile(r'\bdaily\b', re.IGNORECASE)
 
 
 class KingswayScraper(BaseScraper):
     """Scraper for Kingsway Theatre (kingswaymovies.ca)"""
     
+    PRIMARY_SELECTOR = "img[alt]"
+    
     def __init__(self):
         config = THEATERS["kingsway"]
         super().__init__("kingsway", config["name"], config["url"])
+        # (weekday, "Monday, January 26") for each upcoming day, keyed by weeks_ahead
+        self._upcoming_days = {}
         
     def parse_schedule_text(self, text: str) -> list:
         """
@@ -51,7 +87,7 @@ class KingswayScraper(BaseScraper):
         
         # Smart split: only split on "/" when followed by "daily" or a time pattern
         # This preserves "Fri/Mon" as a unit while splitting "1:00 pm / daily 7:00 pm"
-        parts = re.split(r'\s*/\s*(?=daily|\d{1,2}:\d{2})', text, flags=re.IGNORECASE)
+        parts = SCHEDULE_SPLIT_PATTERN.split(text)
         
         for part in parts:
             times = TIME_PATTERN.findall(part)
@@ -62,26 +98,21 @@ class KingswayScraper(BaseScraper):
             if 'daily' in part.lower():
                 # All days of the week
                 for time_str in times:
-                    schedules.append((list(range(7)), time_str))
+                    schedules.append((ALL_DAYS, time_str))
                 continue
                 
-            # Find day references (handle "/" between days as OR)
-            # First, expand any day/day patterns
-            expanded_part = part
+            # Find day references in one scan: "/"-joined groups ("Fri/Mon"
+            # means each of those days; a single day is a group of one),
+            # each optionally ending a "... to Thurs" range
             day_indices = set()
-            
-            # Handle "Mon to Thurs" ranges first
-            range_matches = list(re.finditer(
-                r'(\w+)\s+to\s+(\w+)', 
-                expanded_part, 
-                re.IGNORECASE
-            ))
-            for range_match in range_matches:
-                start_day = range_match.group(1).lower()
-                end_day = range_match.group(2).lower()
+            for match in SCHEDULE_DAYS_PATTERN.finditer(part):
+                group_days = [DAY_MAP[name.lower()] for name in SLASH_PATTERN.split(match.group('days'))]
+                day_indices.update(group_days)
                 
-                if start_day in DAY_MAP and end_day in DAY_MAP:
-                    start_idx = DAY_MAP[start_day]
+                end_day = (match.group('end') or '').lower()
+                if end_day in DAY_MAP:
+                    # Range from the day just before "to"
+                    start_idx = group_days[-1]
                     end_idx = DAY_MAP[end_day]
                     
                     # Handle week wraparound
@@ -90,28 +121,6 @@ class KingswayScraper(BaseScraper):
                     else:
                         day_indices.update(range(start_idx, 7))
                         day_indices.update(range(0, end_idx + 1))
-            
-            # Handle "/" between day names (e.g., "Fri/Mon", "Sat/Sun")
-            # These are additional days, not separators
-            day_slash_pattern = re.compile(
-                r'((?:mon|tues?|wed|thurs?|fri|sat|sun|monday|tuesday|wednesday|thursday|friday|saturday|sunday)(?:\s*/\s*(?:mon|tues?|wed|thurs?|fri|sat|sun|monday|tuesday|wednesday|thursday|friday|saturday|sunday))*)',
-                re.IGNORECASE
-            )
-            day_groups = day_slash_pattern.findall(part)
-            for group in day_groups:
-                # Split by "/" to get individual days
-                individual_days = re.split(r'\s*/\s*', group)
-                for day_name in individual_days:
-                    day_lower = day_name.lower().strip()
-                    if day_lower in DAY_MAP:
-                        day_indices.add(DAY_MAP[day_lower])
-            
-            # Also find any standalone day names not caught above
-            all_days = DAY_PATTERN.findall(part)
-            for day_name in all_days:
-                day_lower = day_name.lower()
-                if day_lower in DAY_MAP:
-                    day_indices.add(DAY_MAP[day_lower])
                         
             if day_indices:
                 for time_str in times:
@@ -119,7 +128,7 @@ class KingswayScraper(BaseScraper):
             else:
                 # No days specified, assume daily
                 for time_str in times:
-                    schedules.append((list(range(7)), time_str))
+                    schedules.append((ALL_DAYS, time_str))
                     
         return schedules
         
@@ -128,17 +137,22 @@ class KingswayScraper(BaseScraper):
         Expand day indices to actual dates for the next N weeks.
         Returns list of formatted showtime strings.
         """
-        showtimes = []
-        today = datetime.now().date()
+        upcoming = self._upcoming_days.get(weeks_ahead)
+        if upcoming is None:
+            # Every film shares the same window; format each date only once
+            # Weekdays just cycle from today's, so step ordinals rather than
+            # adding a timedelta and asking each date for its weekday
+            today = datetime.now().date()
+            today_ord = today.toordinal()
+            today_wd = today.weekday()
+            upcoming = [
+                ((today_wd + day_offset) % 7, format_date(date.fromordinal(today_ord + day_offset)))
+                for day_offset in range(weeks_ahead * 7)
+            ]
+            self._upcoming_days[weeks_ahead] = upcoming
         
-        for day_offset in range(weeks_ahead * 7):
-            target_date = today + timedelta(days=day_offset)
-            
-            if target_date.weekday() in day_indices:
-                date_str = target_date.strftime("%A, %B %d").replace(" 0", " ")
-                showtimes.append(f"{date_str}, {time_str}")
-                
-        return showtimes
+        day_set = frozenset(day_indices)
+        return [f"{date_str}, {time_str}" for weekday, date_str in upcoming if weekday in day_set]
         
     def extract_title_from_alt(self, alt_text: str) -> str:
         """
@@ -158,7 +172,7 @@ class KingswayScraper(BaseScraper):
             schedule_start = min(schedule_start, day_match.start())
             
         # Check for "daily"
-        daily_match = re.search(r'\bdaily\b', text, re.IGNORECASE)
+        daily_match = DAILY_PATTERN.search(text)
         if daily_match:
             schedule_start = min(schedule_start, daily_match.start())
             
@@ -176,22 +190,17 @@ class KingswayScraper(BaseScraper):
         return title
         
     def scrape(self):
-        # Find all images that might contain movie info
-        images = self.driver.find_elements(By.TAG_NAME, "img")
+        # Read every image's alt/title text and parent link in one script call
+        # rather than several WebDriver lookups per image
+        images = self.driver.execute_script(IMAGE_LISTINGS_JS)
         print(f"🔍 [{self.theater_name}] Checking {len(images)} images")
         
-        seen = set()
-        
-        for img in images:
-            # Get alt text or title
-            alt_text = img.get_attribute("alt") or img.get_attribute("title") or ""
-            
+        for alt_text, parent_href in images:
             if not alt_text:
                 continue
                 
             # Skip non-movie images (headers, logos, etc.)
-            skip_keywords = ['kingsway theatre', 'twitter', 'facebook', 'logo', 'header']
-            if any(kw in alt_text.lower() for kw in skip_keywords):
+            if SKIP_PATTERN.search(alt_text):
                 continue
                 
             # Check if this looks like a movie listing (has time info)
@@ -205,24 +214,15 @@ class KingswayScraper(BaseScraper):
                 
             schedules = self.parse_schedule_text(alt_text)
             
-            # Try to get a link from parent element
-            link = self.url
-            try:
-                parent = img.find_element(By.XPATH, "./..")
-                if parent.tag_name == "a":
-                    link = parent.get_attribute("href") or self.url
-            except Exception:
-                pass
+            # Link from the parent <a>, if the image is wrapped in one
+            link = parent_href or self.url
                 
             # Expand schedules to actual dates
             for day_indices, time_str in schedules:
                 showtimes = self.expand_to_dates(day_indices, time_str)
                 
                 for showtime in showtimes:
-                    key = (title, showtime)
-                    if key not in seen:
-                        seen.add(key)
-                        self.add_film(title, showtime, link)
+                    self.add_film(title, showtime, link)
                         
         return self.films
 
@@ -1,50 +1,173 @@
 """
 Paradise Theatre scraper - simple page load with showtime blocks.
+
+The showtime blocks are server-rendered, so the page is fetched over plain
+HTTP and parsed directly; Chrome is only started if the HTML has no blocks
+or they look malformed.
 """
 
-from selenium.webdriver.common.by import By
+import re
+from html.parser import HTMLParser
+from urllib.parse import urljoin
 from .base import BaseScraper
 
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from config import THEATERS
 
+# A block's date: "Today, Jul 21", "Wed, Jul 22"
+DATE_PATTERN = re.compile(r'[A-Za-z]+\s*,?\s*[A-Za-z]+\.?\s+\d{1,2}')
+
+# A showtime: "6:00 pm", optionally followed by a label ("6:00 pm SOLD OUT")
+TIME_PATTERN = re.compile(r'\d{1,2}:\d{2}\s*(?:am|pm)\b', re.IGNORECASE)
+
+# [title, href, date, [times]] for every film block on the rendered page
+FILM_BLOCKS = (".showtimes-description", (
+    (".show-title a", "innerText"),
+    (".show-title a", "href"),
+    (".selected-date", "innerText"),
+    (".showtime", "innerText", True),
+))
+
+
+class ShowtimeBlocksParser(HTMLParser):
+    """Collect [title, href, date, [times]] for each `.showtimes-description`.
+
+    Reads the same fields the browser path reads (`.show-title a`,
+    `.selected-date`, `.showtime`) straight from the HTML.
+    """
+
+    VOID_TAGS = {'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input',
+                 'link', 'meta', 'source', 'track', 'wbr'}
+
+    def __init__(self):
+        super().__init__()
+        self.blocks = []
+        self._depth = 0
+        self._block_depth = None
+        self._title_depth = None
+        self._field = None
+        self._field_depth = None
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self.VOID_TAGS:
+            if tag == 'br':
+                # A line break in the rendered text ("8:30 pm<br>SOLD OUT")
+                self.handle_data(' ')
+            return
+        self._depth += 1
+        attrs = dict(attrs)
+        classes = (attrs.get('class') or '').split()
+
+        if 'showtimes-description' in classes:
+            # Every block opens a new entry, even if the previous one left a
+            # tag (an unclosed <p> or <li>) open and so never "ended"
+            self._block_depth = self._depth
+            self._title_depth = self._field = self._field_depth = None
+            self.blocks.append(['', None, '', []])
+        elif self._block_depth is None or self._field is not None:
+            return
+        elif 'show-title' in classes:
+            self._title_depth = self._depth
+        elif tag == 'a' and self._title_depth is not None and self.blocks[-1][1] is None:
+            self.blocks[-1][1] = attrs.get('href')
+            self._field, self._field_depth = 0, self._depth
+        elif 'selected-date' in classes:
+            self._field, self._field_depth = 2, self._depth
+        elif 'showtime' in classes:
+            self.blocks[-1][3].append('')
+            self._field, self._field_depth = 3, self._depth
+
+    def handle_data(self, data):
+        if self._field is None:
+            return
+        block = self.blocks[-1]
+        if self._field == 3:
+            block[3][-1] += data
+        elif self._field == 2:
+            # The day and date sit in separate elements; rendered text puts a
+            # line break between them, which the browser path turns into a space
+            block[2] += ' ' + data
+        else:
+            block[0] += data
+
+    def handle_endtag(self, tag):
+        if tag in self.VOID_TAGS:
+            return
+        if self._depth == self._field_depth:
+            self._field = self._field_depth = None
+        if self._depth == self._title_depth:
+            self._title_depth = None
+        if self._depth == self._block_depth:
+            self._block_depth = None
+        self._depth -= 1
+
 
 class ParadiseScraper(BaseScraper):
     """Scraper for Paradise Theatre (paradiseonbloor.com)"""
     
+    USES_BROWSER = False  # blocks are in the page source; Chrome is a fallback
+    PRIMARY_SELECTOR = ".showtimes-description"
+    
     def __init__(self):
         config = THEATERS["paradise"]
         super().__init__("paradise", config["name"], config["url"])
         
+    def _fetch_blocks(self):
+        """Read the film blocks from the server-rendered HTML."""
+        try:
+            html = self.fetch_html()
+        except Exception as e:
+            print(f"⚠️  [{self.theater_name}] HTTP fetch failed: {e}")
+            return []
+        
+        parser = ShowtimeBlocksParser()
+        parser.feed(html)
+        parser.close()
+        blocks = [
+            (" ".join(title.split()) or "Untitled",
+             urljoin(self.url, href) if href else None,
+             " ".join(date.split()) or "Unknown",
+             [" ".join(t.split()) for t in times if t.strip()])
+            for title, href, date, times in parser.blocks
+        ]
+        # Markup the parser misread (two blocks' dates or times run together)
+        # means the browser should read the page instead
+        for title, href, date, times in blocks:
+            if times and not DATE_PATTERN.fullmatch(date) or any(
+                    not TIME_PATTERN.match(t) or len(TIME_PATTERN.findall(t)) != 1 for t in times):
+                print(f"⚠️  [{self.theater_name}] Unexpected film block markup for '{title}': '{date}' / {times}")
+                return []
+        return blocks
+        
+    def _browser_blocks(self):
+        """Fallback: render the page in Chrome and read the film blocks.
+
+        All blocks are read in-page with one script call rather than four
+        WebDriver lookups per block.
+        """
+        self.driver = self.setup_driver(self.theater_id)
+        if not self.load_page():
+            return []
+        
+        blocks = []
+        for title, link, date, times in self.extract(*FILM_BLOCKS):
+            blocks.append((
+                title.strip() or "Untitled",
+                link or None,
+                date.strip().replace("\n", " ") or "Unknown",
+                [t.strip() for t in times if t.strip()],
+            ))
+        return blocks
+        
     def scrape(self):
-        film_blocks = self.driver.find_elements(By.CLASS_NAME, "showtimes-description")
+        film_blocks = self._fetch_blocks()
+        if not film_blocks:
+            # Nothing usable in the server-rendered HTML; the page may need
+            # JavaScript, or its markup changed
+            print(f"⚠️  [{self.theater_name}] No usable film blocks in page source, falling back to browser")
+            film_blocks = self._browser_blocks()
         print(f"✅ [{self.theater_name}] Found {len(film_blocks)} film blocks")
         
-        for block in film_blocks:
-            # Get title and link
-            try:
-                title_tag = block.find_element(By.CLASS_NAME, "show-title").find_element(By.TAG_NAME, "a")
-                title = title_tag.text.strip()
-                link = title_tag.get_attribute("href")
-            except Exception:
-                title, link = "Untitled", None
-                
-            # Get date
-            try:
-                date_tag = block.find_element(By.CLASS_NAME, "selected-date")
-                date = date_tag.text.strip().replace("\n", " ")
-            except Exception:
-                date = "Unknown"
-                
-            # Get showtimes
-            try:
-                time_tags = block.find_elements(By.CLASS_NAME, "showtime")
-                times = [t.text.strip() for t in time_tags if t.text.strip()]
-            except Exception:
-                times = []
-                
+        for title, link, date, times in film_blocks:
             # Add each showtime as a separate entry
             for time_str in times:
                 showtime = f"{date}, {time_str}"
@@ -3,55 +3,58 @@ Test scraper for Revue calendar page.
 Parses embedded event JSON from /calendar/ and writes the same item shape the project expects.
 """
 
-from urllib.request import Request, urlopen
 from urllib.parse import urljoin
-from datetime import datetime
-from .base import BaseScraper
+from datetime import date, time
+from .base import BaseScraper, DAY_NAMES, MONTH_NAMES
 
-import sys
-import os
 import re
 import json
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from config import THEATERS
 
-UA = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36'
 CAL_URL = 'https://revuecinema.ca/calendar/'
 
+# The page contains repeated event objects like:
+# {"title":"...","start":"2026-04-09 21:30:00","url":"https://..."}
+EVENT_PATTERN = re.compile(r'\{"title":"(.*?)","start":"(\d{4}-\d{2}-\d{2}) (\d{2}:\d{2}:\d{2})","url":"(https://revuecinema\.ca/films/.*?)"\}')
+
 
 class RevueScraper(BaseScraper):
     MIN_EXPECTED_FILMS = 20
+    USES_BROWSER = False  # events are embedded in the calendar page source
 
     def __init__(self):
         config = THEATERS['revue']
         super().__init__('revue_calendar_test', config['name'], CAL_URL)
 
-    def fetch_html(self):
-        req = Request(self.url, headers={'User-Agent': UA})
-        with urlopen(req, timeout=30) as r:
-            return r.read().decode('utf-8', errors='ignore')
-
     def scrape(self):
         print(f"📄 Fetching calendar page source: {self.url}")
         html = self.fetch_html()
         print(f"✅ Calendar page source fetched ({len(html)} bytes)")
 
-        # The page contains repeated event objects like:
-        # {"title":"...","start":"2026-04-09 21:30:00","url":"https://..."}
-        pattern = re.compile(r'\{"title":"(.*?)","start":"(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})","url":"(https://revuecinema\.ca/films/.*?)"\}')
-        matches = pattern.findall(html)
+        matches = EVENT_PATTERN.findall(html)
         print(f"🎬 [{self.theater_name}] Found {len(matches)} raw calendar event objects")
 
-        seen = set()
-        for raw_title, raw_start, raw_url in matches:
+        # Many events share a date or a start time; format each one once
+        date_labels = {}
+        time_labels = {}
+        for raw_title, raw_date, raw_time, raw_url in matches:
             title = bytes(raw_title, 'utf-8').decode('unicode_escape')
             link = bytes(raw_url, 'utf-8').decode('unicode_escape')
-            start = datetime.strptime(raw_start, '%Y-%m-%d %H:%M:%S')
-            showtime = start.strftime('%a %b %d, %I:%M %p').replace(' 0', ' ')
-            key = (title, showtime, link)
-            if key in seen:
+            try:
+                date_label = date_labels.get(raw_date)
+                if date_label is None:
+                    day = date.fromisoformat(raw_date)
+                    date_label = f"{DAY_NAMES[day.weekday()][:3]} {MONTH_NAMES[day.month][:3]} {day.day}"  # "Mon Jan 5"
+                    date_labels[raw_date] = date_label
+                time_label = time_labels.get(raw_time)
+                if time_label is None:
+                    start = time.fromisoformat(raw_time)
+                    time_label = f"{start.hour % 12 or 12}:{start.minute:02d} {'AM' if start.hour < 12 else 'PM'}"  # "7:30 PM"
+                    time_labels[raw_time] = time_label
+            except ValueError:
+                print(f"⚠️  [{self.theater_name}] Skipping event with unparseable start: '{raw_date} {raw_time}'")
                 continue
-            seen.add(key)
+            showtime = f"{date_label}, {time_label}"
             self.add_film(title, showtime, urljoin(self.url, link))
 
         print(f"🎬 [{self.theater_name}] Final parsed films: {len(self.films)}")
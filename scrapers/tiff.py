@@ -7,18 +7,116 @@ like 'style__cardTitle___3rkLd' that change on each build.
 """
 
 import re
-from datetime import datetime, timedelta
-from selenium.webdriver.common.by import By
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from zoneinfo import ZoneInfo
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import NoSuchElementException
-from .base import BaseScraper
+from .base import BaseScraper, format_date
 
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from config import THEATERS
 
+try:
+    import orjson  # optional: much faster decoding of the saved TIFF data
+except ImportError:
+    orjson = None
+
+# "Monday Jan 27" / "Monday, Jan 27": month abbreviation and day
+DATE_PATTERN = re.compile(r'(\w+)\s+(\d{1,2})')
+
+# Month abbreviations used in TIFF's date headers
+MONTH_NUMBERS = {
+    'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4,
+    'May': 5, 'Jun': 6, 'Jul': 7, 'Aug': 8,
+    'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12
+}
+
+# Time pattern: "6:00pm", "12:30PM", "6:00pm open_in_new"
+TIME_PATTERN = re.compile(r'(\d{1,2}:\d{2})\s*(am|pm)', re.IGNORECASE)
+
+# Non-screening listings (library hours, exhibitions), matched anywhere in a title
+SKIP_TITLE_PATTERN = re.compile('|'.join(map(re.escape, [
+    'film reference library public hours',
+    'setting the scene exhibition',
+    'public hours',
+    'exhibition',
+])), re.IGNORECASE)
+
+# Everything scrape() reads from the calendar, in one script call, given
+# TiffScraper.SELECTORS as arguments[0]:
+# [date header, [[title, directors, title link href,
+#                 [[ticketed time text, href], ...], [free slot text, ...]], ...]]
+# per date group; null for a group with no movie list
+CALENDAR_LISTINGS_JS = """
+const sel = arguments[0];
+const text = e => e ? (e.innerText || '').trim() : '';
+return Array.from(document.querySelectorAll(sel.date_group)).map(group => {
+    const list = group.querySelector(sel.movie_list);
+    if (!list) return null;
+    const cards = Array.from(list.querySelectorAll(sel.movie_item))
+        .map(item => item.querySelector(sel.result_card))
+        .filter(card => card);
+    return [
+        text(group.querySelector(sel.date_header)),
+        cards.map(card => {
+            const link = card.querySelector(sel.card_title + ' a');
+            return [
+                text(card.querySelector(sel.card_title)),
+                text(card.querySelector(sel.card_directors)),
+                link ? link.href || '' : '',
+                Array.from(card.querySelectorAll(sel.ticketed_showtime)).map(btn => [
+                    btn.querySelector('span') ? text(btn.querySelector('span')) : text(btn),
+                    btn.href || '',
+                ]),
+                Array.from(card.querySelectorAll(sel.free_showtime)).map(text),
+            ];
+        }),
+    ];
+});
+"""
+
+
+@lru_cache(maxsize=128)
+def convert_date(date_text: str, today: date) -> str:
+    """
+    Convert a TIFF date header to "Monday, January 26" (see
+    TiffScraper._convert_date).
+    
+    Cached on (date_text, today): headers repeat within and across scrapes
+    on the same day, and the result only depends on those two values.
+    """
+    # Handle "Today" and "Tomorrow"
+    if date_text.startswith("Today"):
+        target_date = today
+    elif date_text.startswith("Tomorrow"):
+        target_date = today + timedelta(days=1)
+    else:
+        # Try to parse date like "Monday Jan 27" or "Monday, Jan 27"
+        # Extract the month and day
+        match = DATE_PATTERN.search(date_text)
+        if match:
+            month_abbr = match.group(1)
+            day = int(match.group(2))
+            
+            month = MONTH_NUMBERS.get(month_abbr, today.month)
+            
+            # Determine the year (handle year rollover)
+            year = today.year
+            if month < today.month or (month == today.month and day < today.day):
+                year += 1
+            
+            try:
+                target_date = date(year, month, day)
+            except ValueError:
+                # Invalid date, return original
+                return date_text
+        else:
+            # Couldn't parse, return original
+            return date_text
+    
+    # Format as "Monday, January 26"
+    return format_date(target_date)
+
 
 class TiffScraper(BaseScraper):
     """Scraper for TIFF Bell Lightbox (tiff.net/calendar)"""
@@ -45,25 +143,27 @@ class TiffScraper(BaseScraper):
         """Override with longer wait for React rendering.
 
         IMPORTANT: must return a bool so BaseScraper.run() knows whether to continue.
+
+        Args:
+            wait_time: Seconds to allow React to render the calendar (default 60)
         """
         ok = super().load_page()
         if not ok:
             return False
 
-        # BaseScraper.load_page() is intentionally minimal; TIFF needs extra render time.
-        import time
-        time.sleep(wait_time or 20)
-
+        # BaseScraper.load_page() is intentionally minimal; TIFF needs extra
+        # render time. Poll for the rendered calendar rather than sleeping a
+        # fixed time first, so a fast render is scraped straight away.
         try:
             # Wait for React to render date groups
-            wait = WebDriverWait(self.driver, 45)
+            wait = WebDriverWait(self.driver, wait_time or 60, poll_frequency=0.2)
             wait.until(EC.presence_of_element_located(
-                (By.CSS_SELECTOR, self.SELECTORS['date_group'])
+                self.locate('date_group')
             ))
 
             # Additional wait for result cards to render
             wait.until(EC.presence_of_element_located(
-                (By.CSS_SELECTOR, self.SELECTORS['result_card'])
+                self.locate('result_card')
             ))
 
             print(f"🎬 [{self.theater_name}] React app loaded successfully")
@@ -72,7 +172,7 @@ class TiffScraper(BaseScraper):
             print(f"❌ [{self.theater_name}] React calendar did not render: {e}")
             return False
     
-    def _convert_date(self, date_text: str) -> str:
+    def _convert_date(self, date_text: str, today: datetime = None) -> str:
         """
         Convert TIFF date formats to standardized format.
         
@@ -88,53 +188,17 @@ class TiffScraper(BaseScraper):
         
         Args:
             date_text: Date string from TIFF website
+            today: Reference "now" (default: datetime.now()); pass one in when
+                converting many dates in a single scrape
             
         Returns:
             Formatted date string like "Monday, January 26"
         """
         if not date_text:
             return ""
-        
-        # Handle "Today" and "Tomorrow"
-        today = datetime.now()
-        
-        if date_text.startswith("Today"):
-            target_date = today
-        elif date_text.startswith("Tomorrow"):
-            target_date = today + timedelta(days=1)
-        else:
-            # Try to parse date like "Monday Jan 27" or "Monday, Jan 27"
-            # Extract the month and day
-            match = re.search(r'(\w+)\s+(\d{1,2})', date_text)
-            if match:
-                month_abbr = match.group(1)
-                day = int(match.group(2))
-                
-                # Map month abbreviations
-                month_map = {
-                    'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4,
-                    'May': 5, 'Jun': 6, 'Jul': 7, 'Aug': 8,
-                    'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12
-                }
-                
-                month = month_map.get(month_abbr, today.month)
-                
-                # Determine the year (handle year rollover)
-                year = today.year
-                if month < today.month or (month == today.month and day < today.day):
-                    year += 1
-                
-                try:
-                    target_date = datetime(year, month, day)
-                except ValueError:
-                    # Invalid date, return original
-                    return date_text
-            else:
-                # Couldn't parse, return original
-                return date_text
-        
-        # Format as "Monday, January 26"
-        return target_date.strftime("%A, %B %-d" if os.name != 'nt' else "%A, %B %d").replace(" 0", " ")
+        if today is None:
+            today = datetime.now()
+        return convert_date(date_text, today.date())
         
     def _extract_time(self, text: str) -> str:
         """
@@ -154,7 +218,7 @@ class TiffScraper(BaseScraper):
         text = text.strip().lower()
         
         # Use regex to extract time
-        match = re.search(r'(\d{1,2}:\d{2})\s*(am|pm)', text, re.IGNORECASE)
+        match = TIME_PATTERN.search(text)
         if match:
             time_part = match.group(1)
             suffix = match.group(2).upper()
@@ -162,135 +226,69 @@ class TiffScraper(BaseScraper):
             
         return ""
     
-    def _safe_get_text(self, parent, selector: str) -> str:
-        """Safely get text content from an element."""
-        try:
-            element = parent.find_element(By.CSS_SELECTOR, selector)
-            return element.text.strip() if element.text else ""
-        except NoSuchElementException:
-            return ""
-    
-    def _safe_get_attribute(self, parent, selector: str, attribute: str) -> str:
-        """Safely get an attribute from an element."""
-        try:
-            element = parent.find_element(By.CSS_SELECTOR, selector)
-            return element.get_attribute(attribute) or ""
-        except NoSuchElementException:
-            return ""
-        
     def _should_skip_title(self, title: str) -> bool:
         if not title:
             return True
-        lowered = title.lower().strip()
-        skip_phrases = [
-            'film reference library public hours',
-            'setting the scene exhibition',
-            'public hours',
-            'exhibition',
-        ]
-        return any(phrase in lowered for phrase in skip_phrases)
+        return SKIP_TITLE_PATTERN.search(title) is not None
 
     def scrape(self):
         """Main scraping logic."""
-        # Get all date groups
-        date_groups = self.driver.find_elements(
-            By.CSS_SELECTOR, self.SELECTORS['date_group']
-        )
+        # Read every date group's cards in one script call rather than
+        # several WebDriver round-trips per card
+        date_groups = self.driver.execute_script(CALENDAR_LISTINGS_JS, self.SELECTORS)
         
         print(f"🎬 [{self.theater_name}] Found {len(date_groups)} date groups")
         
+        # One clock read for the whole scrape (header dates, today's merge
+        # and the late-day guard), on Toronto time where the zone is known
+        try:
+            now = datetime.now(ZoneInfo("America/Toronto"))
+        except Exception:
+            now = datetime.now()
+        
         for group in date_groups:
-            # Extract date from header
-            date_text = self._safe_get_text(group, self.SELECTORS['date_header'])
+            # Skip date groups without a movie list
+            if group is None:
+                continue
+            date_text, cards = group
             if not date_text:
                 date_text = "Unknown Date"
             
             # Convert to standard format
-            formatted_date = self._convert_date(date_text)
+            formatted_date = self._convert_date(date_text, now)
             
-            # Find movie list within this date group
-            try:
-                movie_list = group.find_element(
-                    By.CSS_SELECTOR, self.SELECTORS['movie_list']
-                )
-            except NoSuchElementException:
-                continue
-                
-            # Get all movie items
-            movie_items = movie_list.find_elements(
-                By.CSS_SELECTOR, self.SELECTORS['movie_item']
-            )
-            
-            for item in movie_items:
-                # Find the result card
-                try:
-                    card = item.find_element(
-                        By.CSS_SELECTOR, self.SELECTORS['result_card']
-                    )
-                except NoSuchElementException:
-                    continue
-                
-                # Extract event details
-                title = self._safe_get_text(card, self.SELECTORS['card_title'])
+            for title, director, event_url, ticketed, free_slots in cards:
                 if not title:
                     continue  # Skip if no title
                 if self._should_skip_title(title):
                     continue
 
-                director = self._safe_get_text(card, self.SELECTORS['card_directors'])
                 if director:
                     title = f"{title} - {director}"
                 
-                # Get event URL from title link
-                event_url = self._safe_get_attribute(
-                    card, 
-                    f"{self.SELECTORS['card_title']} a", 
-                    'href'
-                )
-                
                 # Default link if no specific event URL
                 link = event_url if event_url else self.url
                 
                 # Extract showtimes
                 showtimes_found = []
                 
-                # Ticketed showtimes
-                try:
-                    ticketed_buttons = card.find_elements(
-                        By.CSS_SELECTOR, self.SELECTORS['ticketed_showtime']
-                    )
-                    for btn in ticketed_buttons:
-                        # Try to get time from span first, then full text
-                        try:
-                            span = btn.find_element(By.CSS_SELECTOR, 'span')
-                            time_text = span.text
-                        except NoSuchElementException:
-                            time_text = btn.text
-                            
-                        time = self._extract_time(time_text)
-                        if time:
-                            ticket_link = btn.get_attribute('href')
-                            showtimes_found.append({
-                                'time': time,
-                                'link': ticket_link or link
-                            })
-                except NoSuchElementException:
-                    pass
+                # Ticketed showtimes (time from the button's span, else its text)
+                for time_text, ticket_link in ticketed:
+                    time = self._extract_time(time_text)
+                    if time:
+                        showtimes_found.append({
+                            'time': time,
+                            'link': ticket_link or link
+                        })
                 
                 # Free/drop-in showtimes
-                try:
-                    free_slots = card.find_elements(
-                        By.CSS_SELECTOR, self.SELECTORS['free_showtime']
-                    )
-                    for slot in free_slots:
-                        time = self._extract_time(slot.text)
-                        if time:
-                            showtimes_found.append({
-                                'time': f"{time} (Free)",
-                                'link': link
-                            })
-                except NoSuchElementException:
-                    pass
+                for slot_text in free_slots:
+                    time = self._extract_time(slot_text)
+                    if time:
+                        showtimes_found.append({
+                            'time': f"{time} (Free)",
+                            'link': link
+                        })
                 
                 # Add entry for each showtime (or one entry if no showtimes)
                 if showtimes_found:
@@ -306,9 +304,7 @@ class TiffScraper(BaseScraper):
         # So: if we scraped zero items for today's date, merge in any existing
         # saved entries for today from the previous tiff_films.json.
         try:
-            from datetime import datetime
-            from zoneinfo import ZoneInfo
-            today_str = datetime.now(ZoneInfo("America/Toronto")).strftime("%A, %B %-d").replace(" 0", " ")
+            today_str = format_date(now)
 
             def _date_part(showtime: str) -> str:
                 parts = (showtime or "").split(',')
@@ -319,27 +315,26 @@ class TiffScraper(BaseScraper):
 
             has_today = any(_date_part(f.get('showtime','')) == today_str for f in self.films)
             if not has_today and self.output_file.exists():
-                import json
-                with open(self.output_file, "r", encoding="utf-8") as f:
-                    old = json.load(f)
+                if orjson is not None:
+                    with open(self.output_file, "rb") as f:
+                        old = orjson.loads(f.read())
+                else:
+                    import json
+                    with open(self.output_file, "r", encoding="utf-8") as f:
+                        old = json.load(f)
 
                 keep = [x for x in old if _date_part(x.get('showtime','')) == today_str]
 
                 if keep:
-                    # Merge today's entries back in
-                    seen = set((x.get('title',''), x.get('showtime','')) for x in self.films)
+                    # Merge today's entries back in (repeats are dropped)
                     for x in keep:
-                        key = (x.get('title',''), x.get('showtime',''))
-                        if key not in seen:
-                            self.films.append(x)
-                            seen.add(key)
+                        self.add_film_record(x)
                     print(f"🧩 [{self.theater_name}] TIFF site omitted today; merged {len(keep)} saved entries for {today_str}")
                 else:
                     # Guardrail: if TIFF is returning no 'today' and we have no saved 'today'
                     # entries to merge, do NOT clobber the existing file late in the day.
                     # (TIFF appears to hide same-day listings once showtimes have passed.)
-                    now_local = datetime.now(ZoneInfo("America/Toronto"))
-                    if now_local.hour >= 17:
+                    if now.hour >= 17:
                         print(f"🛡️  [{self.theater_name}] TIFF omitted today and no saved today entries exist; preserving previous TIFF dataset (late-day guard)")
                         return old
         except Exception as e:
@@ -0,0 +1,79 @@
+"""Tests for the Fox movie-page showtime parser (scrapers/fox.py)."""
+
+import unittest
+from pathlib import Path
+
+from scrapers.fox import FoxScraper, ShowtimeItemsParser
+
+FIXTURES = Path(__file__).parent / 'fixtures'
+TICKETS = 'https://tickets.foxtheatre.ca/websales/pages/ticketsearchcriteria.aspx?evtinfo={}~3cc021f8-1c84-4d3e-b58d-8be52cd73055&'
+
+
+def parse(html):
+    parser = ShowtimeItemsParser()
+    parser.feed(html)
+    parser.close()
+    return [[" ".join(field.split()) for field in item] for item in parser.items]
+
+
+class ShowtimeItemsParserTest(unittest.TestCase):
+
+    def test_movie_page(self):
+        items = parse((FIXTURES / 'fox_movie_page.html').read_text(encoding='utf-8'))
+        # The third item leaves a <p> open; the items after it still split
+        self.assertEqual(items, [
+            ['Monday, July 20', '6:30 pm', TICKETS.format(636921)],
+            ['Tuesday, July 21', '3:50 pm', TICKETS.format(636922)],
+            ['Tuesday, July 21', '9:20 pm', TICKETS.format(636923)],
+            ['Wednesday, July 22', '7:00 pm', TICKETS.format(636924)],
+        ])
+
+    def test_unclosed_tag_does_not_merge_items(self):
+        html = ('<div class="showtimes-lists">'
+                '<div class="item"><span class="date">Fri Oct 16</span><p>Showing'
+                '<span class="time">7:00 PM</span></div>'
+                '<div class="item"><span class="date">Sat Oct 17</span>'
+                '<span class="time">9:00 PM</span></div></div>')
+        self.assertEqual(parse(html), [
+            ['Fri Oct 16', '7:00 PM', ''],
+            ['Sat Oct 17', '9:00 PM', ''],
+        ])
+
+    def test_unclosed_tag_does_not_extend_the_list(self):
+        # No extra closing tag after the list rebalances the unclosed <p>
+        html = ('<div class="showtimes-lists">'
+                '<div class="item"><span class="date">Fri Oct 16</span><p>Showing'
+                '<span class="time">7:00 PM</span></div></div>'
+                '<footer><div class="item"><span class="date">Sat Oct 17</span>'
+                '<span class="time">9:00 PM</span></div></footer>')
+        self.assertEqual(parse(html), [['Fri Oct 16', '7:00 PM', '']])
+
+
+class FetchShowtimeItemsTest(unittest.TestCase):
+
+    def scraper_for(self, html):
+        scraper = FoxScraper()
+        scraper.fetch_html = lambda url, timeout=30: html
+        return scraper
+
+    def test_fixture_items(self):
+        html = (FIXTURES / 'fox_movie_page.html').read_text(encoding='utf-8')
+        items = self.scraper_for(html)._fetch_showtime_items('https://www.foxtheatre.ca/movies/the-invite/')
+        self.assertEqual(len(items), 4)
+        self.assertEqual(items[0], ('Monday, July 20', '6:30 pm', TICKETS.format(636921)))
+
+    def test_malformed_item_falls_back(self):
+        # A time run together with text it shouldn't contain
+        html = ('<div class="showtimes-lists"><div class="item">'
+                '<span class="date">Fri Oct 16</span><span class="time">7:00 PM<b>9:00 PM</span>'
+                '</div></div>')
+        self.assertEqual(self.scraper_for(html)._fetch_showtime_items('https://www.foxtheatre.ca/movies/x/'), [])
+
+    def test_date_without_time_falls_back(self):
+        html = ('<div class="showtimes-lists"><div class="item">'
+                '<span class="date">Fri Oct 16</span></div></div>')
+        self.assertEqual(self.scraper_for(html)._fetch_showtime_items('https://www.foxtheatre.ca/movies/x/'), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
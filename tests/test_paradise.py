@@ -0,0 +1,53 @@
+"""Tests for the Paradise showtime block parser (scrapers/paradise.py)."""
+
+import unittest
+from pathlib import Path
+
+from scrapers.paradise import ParadiseScraper
+
+FIXTURES = Path(__file__).parent / 'fixtures'
+
+
+class FetchBlocksTest(unittest.TestCase):
+
+    def scraper_for(self, html):
+        scraper = ParadiseScraper()
+        scraper.fetch_html = lambda url=None, timeout=30: html
+        return scraper
+
+    def test_page(self):
+        html = (FIXTURES / 'paradise_page.html').read_text(encoding='utf-8')
+        # The first block leaves a <p> open; the blocks after it still split
+        self.assertEqual(self.scraper_for(html)._fetch_blocks(), [
+            ('Rose of Nevada', 'https://paradiseonbloor.com/movies/rose-of-nevada/',
+             'Today, Jul 21', ['6:00 pm']),
+            ('Hustler White: 30th Anniversary!', 'https://paradiseonbloor.com/movies/hustler-white-30th-anniversary/',
+             'Today, Jul 21', ['8:30 pm SOLD OUT']),
+            ('Chocolate Babies', 'https://paradiseonbloor.com/movies/chocolate-babies/',
+             'Wed, Jul 22', ['7:30 pm', '9:45 pm']),
+        ])
+
+    def test_unclosed_tag_does_not_merge_blocks(self):
+        html = ('<div class="showtimes-description"><p>'
+                '<div class="show-title"><a href="/a/">A</a></div>'
+                '<div class="selected-date">Fri Oct 16</div><div class="showtime">7:00 pm</div></div>'
+                '<div class="showtimes-description">'
+                '<div class="show-title"><a href="/b/">B</a></div>'
+                '<div class="selected-date">Sat Oct 17</div><div class="showtime">9:00 pm</div></div>')
+        blocks = self.scraper_for(html)._fetch_blocks()
+        self.assertEqual([(title, date, times) for title, _, date, times in blocks], [
+            ('A', 'Fri Oct 16', ['7:00 pm']),
+            ('B', 'Sat Oct 17', ['9:00 pm']),
+        ])
+
+    def test_malformed_block_falls_back(self):
+        # Two dates run together in one block
+        html = ('<div class="showtimes-description">'
+                '<div class="show-title"><a href="/a/">A</a></div>'
+                '<div class="selected-date">Fri Oct 16 Sat Oct 17</div>'
+                '<div class="showtime">7:00 pm</div></div>')
+        self.assertEqual(self.scraper_for(html)._fetch_blocks(), [])
+
+
+if __name__ == '__main__':
+    unittest.main()